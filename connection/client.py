@@ -1,68 +1,169 @@
+import asyncio
 import logging
-import queue
-import socket
-import time
-from typing import Dict, Optional
-from PyQt5.QtCore import pyqtSlot, QThread
-from connection.messenger import Messenger
+from typing import Any, Callable, Dict, Optional
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, QThread
+from connection.messenger import MessageBuffer, Messenger
 from connection.params import PORT
+from connection.protocol import MessageProtocol
+
+
+class ServerConnection(MessageProtocol):
+    """
+    Class for connection of client to server.
+    """
+
+    def __init__(self, client: "Client") -> None:
+        """
+        :param client: client.
+        """
+
+        super().__init__()
+        self._client: Client = client
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        super().connection_lost(exc)
+        self._client._remove_connection(self)
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        super().connection_made(transport)
+        self.send_message(Messenger.get_hello_message())
+
+    def handle_data(self, buffer: MessageBuffer) -> None:
+        self._client._get_messages(self, buffer)
 
 
 class Client(QThread):
     """
-    Class for client.
+    Class for client. Client runs asyncio event loop in its thread and keeps connection to server open, messages are
+    sent as soon as they are passed to client and messages from server are emitted as signals.
     """
 
+    CONNECTION_TIMEOUT: float = 3
+    connection_failed: pyqtSignal = pyqtSignal(str)
+    disconnected: pyqtSignal = pyqtSignal(str)
+    message_received: pyqtSignal = pyqtSignal(dict)
+
     def __init__(self) -> None:
         super().__init__()
-        self._host: str = None
-        self._port: int = PORT
+        self._connection: Optional[ServerConnection] = None
+        self._connection_lock: Optional[asyncio.Lock] = None
+        self._host: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._messenger: Messenger = Messenger()
-        self._queue: queue.Queue = queue.Queue()
-        self._socket: socket.socket = None
+        self._port: int = PORT
+        self._stop: bool = False
 
-    def connect(self, host: str) -> None:
+    def _call_in_loop(self, callback: Callable, *args) -> None:
         """
-        Method connects client to server.
-        :param host: server address to connect.
+        Method schedules callback in event loop of client from another thread.
+        :param callback: callback;
+        :param args: arguments of callback.
         """
 
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            self._socket.connect((host, self._port))
-        except ConnectionRefusedError:
-            time.sleep(1)
+            self._loop.call_soon_threadsafe(callback, *args)
+        except (AttributeError, RuntimeError):
+            logging.debug("Client is not running")
+
+    async def _connect(self, host: str) -> bool:
+        """
+        Method connects client to server. If client is already connected to this server, connection is reused.
+        :param host: server address to connect.
+        :return: True if client is connected.
+        """
+
+        async with self._connection_lock:
+            if self._connection is not None and self._connection.is_connected() and self._host == host:
+                return True
+            if self._connection is not None:
+                self._connection.close()
+            self._host = host
+            try:
+                _, self._connection = await asyncio.wait_for(
+                    self._loop.create_connection(lambda: ServerConnection(self), host, self._port),
+                    self.CONNECTION_TIMEOUT)
+            except (OSError, asyncio.TimeoutError) as exc:
+                logging.error("Failed to connect to server %s: %s", host, exc)
+                self._connection = None
+                self.connection_failed.emit(host)
+                return False
+            return True
 
-    def process_message(self) -> Optional[Dict[str, str]]:
+    def _get_messages(self, connection: ServerConnection, buffer: MessageBuffer) -> None:
         """
-        Method parses message from server.
+        Method decodes complete messages received from server and emits them.
+        :param connection: connection to server;
+        :param buffer: buffer with data received from server.
         """
 
         try:
-            return self._messenger.get_message(self._socket)
-        except Exception:
-            pass
+            for encoded_message in buffer.extract_messages():
+                message = self._messenger.decode_message(encoded_message)
+                if message.get("MESSAGE") == "Hello":
+                    connection.handle_hello(message, reply=False)
+                else:
+                    self.message_received.emit(message)
+        except Exception as exc:
+            logging.error("Invalid message from server %s: %s", connection.address, exc)
+            connection.close()
+
+    def _remove_connection(self, connection: ServerConnection) -> None:
+        """
+        Method forgets closed connection and reports that server disconnected, unless client is stopping.
+        :param connection: closed connection.
+        """
+
+        if self._connection is connection:
+            self._connection = None
+            if not self._stop:
+                self.disconnected.emit(connection.address)
+
+    def _send_message(self, message: Dict[str, Any]) -> None:
+        if self._connection is not None:
+            self._connection.send_message(message)
+        else:
+            logging.error("Client is not connected to server")
+
+    async def _send_to_host(self, host: str, message: Dict[str, Any]) -> None:
+        """
+        Method connects to server if needed and sends message.
+        :param host: server address;
+        :param message: message.
+        """
+
+        if await self._connect(host):
+            self._connection.send_message(message)
+
+    def close_client(self) -> None:
+        """
+        Method closes connection and stops client.
+        """
+
+        self._stop = True
+        if self._loop is not None:
+            self._call_in_loop(self._loop.stop)
+        self.wait()
 
     def run(self) -> None:
-        while True:
-            if not self._queue.empty():
-                task = self._queue.get()
-                try:
-                    task()
-                except Exception as exc:
-                    logging.error(exc)
-            time.sleep(0.5)
-
-    def send_message(self, message: Dict[str, str]) -> None:
-        """
-        Method sends messages to server.
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._connection_lock = asyncio.Lock()
+        try:
+            if not self._stop:
+                self._loop.run_forever()
+        finally:
+            if self._connection is not None:
+                self._connection.close()
+            self._loop.run_until_complete(asyncio.sleep(0))
+            self._loop.close()
+
+    def send_message(self, message: Dict[str, Any]) -> None:
+        """
+        Method sends message to server client is connected to, it can be called from any thread.
         :param message: message to send.
         """
 
-        try:
-            self._messenger.send_message(self._socket, message)
-        except Exception:
-            pass
+        self._call_in_loop(self._send_message, message)
 
     @pyqtSlot(str)
     def start_game(self, address: str) -> None:
@@ -71,5 +172,7 @@ class Client(QThread):
         :param address: server IP address.
         """
 
-        self._queue.put(lambda: self.connect(address))
-        self._queue.put(lambda: self.send_message({"MESSAGE": "Start game"}))
+        if self._loop is None or self._loop.is_closed():
+            logging.debug("Client is not running")
+            return
+        asyncio.run_coroutine_threadsafe(self._send_to_host(address, {"MESSAGE": "Start game"}), self._loop)
@@ -0,0 +1,131 @@
+from typing import Any, Dict, List, Optional
+from connection.messenger import Messenger
+from connection.protocol import MessageProtocol
+
+
+class EncodedMessage:
+    """
+    Class for message that is encoded once for every protocol version and then sent to any number of connections.
+    """
+
+    def __init__(self, message: Dict[str, Any]) -> None:
+        """
+        :param message: message.
+        """
+
+        self._encoded_messages: Dict[int, bytes] = {}
+        self._message: Dict[str, Any] = message
+
+    def get(self, protocol_version: int) -> bytes:
+        """
+        Method returns message encoded with header for protocol version.
+        :param protocol_version: version of protocol.
+        :return: encoded message.
+        """
+
+        encoded_message = self._encoded_messages.get(protocol_version)
+        if encoded_message is None:
+            encoded_message = Messenger.encode_message(self._message, protocol_version)
+            self._encoded_messages[protocol_version] = encoded_message
+        return encoded_message
+
+    def send(self, connection: MessageProtocol) -> None:
+        connection.send_encoded_message(self.get(connection.protocol_version))
+
+
+class LiveGame:
+    """
+    Class for game that is broadcast to spectators. Every move is encoded once and the same bytes are queued to all
+    spectators. Spectator that joins game in progress gets snapshot with all moves made so far and then gets moves
+    as they are made. Spectators drop messages when their send queues are full, spectator that missed message gets
+    snapshot instead of the next move.
+    """
+
+    def __init__(self, game_id: int, size: int, win_length: int) -> None:
+        """
+        :param game_id: ID of game;
+        :param size: number of rows and columns on playing field;
+        :param win_length: number of symbols in a row to win.
+        """
+
+        self._game_id: int = game_id
+        self._moves: List[int] = []
+        self._size: int = size
+        self._snapshot: Optional[EncodedMessage] = None
+        self._spectators: Dict[MessageProtocol, bool] = {}
+        self._win_length: int = win_length
+        self._winner: Optional[int] = None
+
+    @property
+    def game_id(self) -> int:
+        return self._game_id
+
+    @property
+    def spectators_number(self) -> int:
+        return len(self._spectators)
+
+    def _broadcast(self, message: EncodedMessage) -> None:
+        """
+        Method sends message to all spectators.
+        :param message: message.
+        """
+
+        for spectator, needs_snapshot in self._spectators.items():
+            self._send(spectator, self._get_snapshot() if needs_snapshot else message)
+
+    def _get_snapshot(self) -> EncodedMessage:
+        """
+        Method returns message with current state of game, message is encoded once after every move.
+        :return: snapshot.
+        """
+
+        if self._snapshot is None:
+            self._snapshot = EncodedMessage({"MESSAGE": "Snapshot", "GAME": self._game_id, "SIZE": self._size,
+                                             "WIN_LENGTH": self._win_length, "MOVES": list(self._moves),
+                                             "WINNER": self._winner})
+        return self._snapshot
+
+    def _send(self, spectator: MessageProtocol, message: EncodedMessage) -> None:
+        """
+        Method sends message to spectator. If message is dropped, spectator gets snapshot instead of the next message
+        until snapshot is queued.
+        :param spectator: connection of spectator;
+        :param message: message.
+        """
+
+        dropped_messages_number = spectator.dropped_messages_number
+        message.send(spectator)
+        self._spectators[spectator] = spectator.dropped_messages_number != dropped_messages_number
+
+    def add_move(self, cell: int, player: int) -> None:
+        """
+        Method saves move and sends it to spectators.
+        :param cell: index of cell;
+        :param player: index of player.
+        """
+
+        self._moves.append(cell)
+        self._snapshot = None
+        self._broadcast(EncodedMessage({"MESSAGE": "Move", "GAME": self._game_id, "CELL": cell, "PLAYER": player}))
+
+    def add_spectator(self, spectator: MessageProtocol) -> None:
+        """
+        Method subscribes spectator to game and sends snapshot of game to it.
+        :param spectator: connection of spectator.
+        """
+
+        spectator.overflow_policy = MessageProtocol.DROP
+        self._send(spectator, self._get_snapshot())
+
+    def finish(self, winner: int) -> None:
+        """
+        Method sends result of game to spectators.
+        :param winner: index of winner or -1 in case of draw.
+        """
+
+        self._winner = winner
+        self._snapshot = None
+        self._broadcast(EncodedMessage({"MESSAGE": "Game over", "GAME": self._game_id, "WINNER": winner}))
+
+    def remove_spectator(self, spectator: MessageProtocol) -> None:
+        self._spectators.pop(spectator, None)
@@ -1,68 +1,232 @@
 import json
-import socket
 import struct
-from typing import Dict, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from monitoring import metrics
+
+
+RECEIVED_MESSAGES: metrics.Counter = metrics.counter("received_messages_total", "Number of messages received")
+
+
+class BinaryRecord(NamedTuple):
+    """
+    Layout of message type in binary protocol.
+    """
+
+    code: int
+    name: str
+    fields: Tuple[str, ...]
+    layout: struct.Struct
 
 
 class Messenger:
     """
-    Class for sending and receiving messages between a client and a server.
+    Class for encoding and decoding messages exchanged between a client and a server.
+    Message is sent as 4 bytes with size of message followed by message. In protocol version 1 every message is JSON
+    dictionary. In protocol version 2 high-frequency messages are fixed-layout records: byte with type of message and
+    packed fields; other messages are still sent as JSON. Binary record never starts with "{", so receiver decodes
+    both formats. Peers agree on version with "Hello" messages.
     """
 
-    def get_message(self, sock: socket.socket) -> Dict[str, str]:
+    BINARY_PROTOCOL_VERSION: int = 2
+    BINARY_RECORDS: Tuple[BinaryRecord, ...] = (
+        BinaryRecord(1, "Move", ("GAME", "CELL", "PLAYER"), struct.Struct(">BIHB")),
+        BinaryRecord(2, "Ack", ("SEQUENCE",), struct.Struct(">BI")),
+        BinaryRecord(3, "Start game", (), struct.Struct(">B")),
+        BinaryRecord(4, "Game over", ("GAME", "WINNER"), struct.Struct(">BIb")),
+        BinaryRecord(5, "Ping", ("TIME",), struct.Struct(">Bd")),
+        BinaryRecord(6, "Pong", ("TIME",), struct.Struct(">Bd")))
+    HEADER: struct.Struct = struct.Struct(">I")
+    JSON_PROTOCOL_VERSION: int = 1
+    MAX_MESSAGE_SIZE: int = 1 << 20
+    PROTOCOL_VERSION: int = BINARY_PROTOCOL_VERSION
+    _RECORDS_BY_CODE: Dict[int, BinaryRecord] = {record.code: record for record in BINARY_RECORDS}
+    _RECORDS_BY_NAME: Dict[str, BinaryRecord] = {record.name: record for record in BINARY_RECORDS}
+
+    @classmethod
+    def _encode_binary_message(cls, message: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Method encodes message as binary record.
+        :param message: dictionary of message.
+        :return: encoded message without header or None if message does not match any binary record.
+        """
+
+        record = cls._RECORDS_BY_NAME.get(message.get("MESSAGE"))
+        if record is None or len(message) != len(record.fields) + 1:
+            return None
+        try:
+            return record.layout.pack(record.code, *(message[field] for field in record.fields))
+        except (KeyError, struct.error):
+            return None
+
+    @classmethod
+    def decode_message(cls, encoded_message: Union[bytes, bytearray, memoryview]) -> Dict[str, Any]:
         """
-        Method receives and decodes message from given socket.
-        :param sock: socket.
+        Method decodes message in any protocol version.
+        :param encoded_message: encoded message without header.
         :return: message.
         """
 
-        encoded_message = self.receive_entire_encoded_message(sock)
-        if not isinstance(encoded_message, bytes):
-            raise ValueError
-        json_message = encoded_message.decode("utf-8")
-        return json.loads(json_message)
+        if encoded_message[:1] == b"{":
+            return json.loads(str(encoded_message, "utf-8"))
+        record = cls._RECORDS_BY_CODE.get(encoded_message[0] if encoded_message else None)
+        if record is None or len(encoded_message) != record.layout.size:
+            raise ValueError("Unknown binary message")
+        _, *values = record.layout.unpack(encoded_message)
+        message = {"MESSAGE": record.name}
+        message.update(zip(record.fields, values))
+        return message
 
-    def receive_entire_encoded_message(self, sock: socket.socket) -> bytes:
+    @classmethod
+    def encode_message(cls, message: Dict[str, Any], protocol_version: int = JSON_PROTOCOL_VERSION) -> bytes:
         """
-        Method for reading entire encoded message from given socket.
-        :param sock: socket.
+        Method encodes message with header that contains size of message.
+        :param message: dictionary of message;
+        :param protocol_version: version of protocol agreed with receiver.
         :return: encoded message.
         """
 
-        raw_message_length = self.receive_given_size_message(sock, 4)
-        message_length = struct.unpack(">I", raw_message_length)[0]
-        return self.receive_given_size_message(sock, message_length)
+        encoded_message = cls.encode_payload(message, protocol_version)
+        return cls.HEADER.pack(len(encoded_message)) + encoded_message
 
-    @staticmethod
-    def receive_given_size_message(sock: socket.socket, message_length: int) -> Optional[bytes]:
+    @classmethod
+    def encode_payload(cls, message: Dict[str, Any], protocol_version: int = JSON_PROTOCOL_VERSION) -> bytes:
         """
-        Method for reading a message of a given size from given socket.
-        :param sock: socket;
-        :param message_length: size of message.
+        Method encodes message without header.
+        :param message: dictionary of message;
+        :param protocol_version: version of protocol agreed with receiver.
+        :return: encoded message.
+        """
+
+        encoded_message = None
+        if protocol_version >= cls.BINARY_PROTOCOL_VERSION:
+            encoded_message = cls._encode_binary_message(message)
+        if encoded_message is None:
+            encoded_message = json.dumps(message).encode("utf-8")
+        return encoded_message
+
+    @classmethod
+    def get_hello_message(cls) -> Dict[str, Any]:
+        """
+        Method returns message that offers the latest protocol version to peer.
         :return: message.
         """
 
-        data = b""
-        while len(data) < message_length:
-            packet = sock.recv(message_length - len(data))
-            if not packet:
-                return None
-            data += packet
-        return data
+        return {"MESSAGE": "Hello", "PROTOCOL": cls.PROTOCOL_VERSION}
+
 
-    @staticmethod
-    def send_message(sock: socket.socket, message: Dict[str, str]) -> None:
+class MessageBuffer:
+    """
+    Class for buffer of data received from stream. Data is received directly into free space at the end of buffer
+    and all complete messages are parsed in place. Consumed data is dropped by moving offset, remaining data is
+    moved to the beginning of buffer only before next receive when there is no free space left, so extracted
+    messages stay valid until then. Buffer starts small and grows for large messages, when all data is consumed
+    grown buffer is replaced with buffer of initial size, so idle connections hold little memory.
+    """
+
+    INITIAL_SIZE: int = 1 << 12
+    MIN_FREE_SPACE: int = 1 << 12
+
+    def __init__(self, size: int = INITIAL_SIZE) -> None:
         """
-        Method encodes and sends a message to socket. The protocol for sending messages
-        is as follows. First, 4 bytes with the size of the message dictionary are sent,
-        and then the message dictionary is sent.
-        :param sock: socket;
-        :param message: dictionary of message.
+        :param size: initial size of buffer in bytes.
+        """
+
+        self._data: bytearray = bytearray(size)
+        self._end: int = 0
+        self._incomplete_message_size: int = 0
+        self._initial_size: int = size
+        self._start: int = 0
+        self._view: memoryview = memoryview(self._data)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _get_message_end(self) -> Optional[int]:
+        """
+        Method checks whether buffer starts with complete message.
+        :return: end of message in buffer or None if message is not complete.
+        """
+
+        if self._end - self._start < Messenger.HEADER.size:
+            return None
+        message_length = Messenger.HEADER.unpack_from(self._data, self._start)[0]
+        if message_length > Messenger.MAX_MESSAGE_SIZE:
+            raise ValueError(f"Message of size {message_length} is too large")
+        end = self._start + Messenger.HEADER.size + message_length
+        if end > self._end:
+            self._incomplete_message_size = Messenger.HEADER.size + message_length
+            return None
+        return end
+
+    def _reserve(self, size: int) -> None:
+        """
+        Method makes sure that buffer can hold data of given size from the beginning of unconsumed data.
+        :param size: size of data.
+        """
+
+        if self._start + size <= len(self._data):
+            return
+        if size > len(self._data):
+            data = bytearray(max(size, 2 * len(self._data)))
+            data[:len(self)] = self._view[self._start:self._end]
+            self._data = data
+            self._view = memoryview(data)
+        else:
+            self._view[:len(self)] = self._view[self._start:self._end]
+        self._end -= self._start
+        self._start = 0
+
+    def extract_message(self) -> Optional[memoryview]:
+        """
+        Method extracts the first complete message from buffer.
+        :return: encoded message without header or None if there is no complete message. Message is a view of buffer,
+        it is valid until next data is received.
+        """
+
+        end = self._get_message_end()
+        if end is None:
+            return None
+        message = self._view[self._start + Messenger.HEADER.size:end]
+        self._start = end
+        return message
+
+    def extract_messages(self) -> List[memoryview]:
+        """
+        Method extracts all complete messages from buffer, incomplete message stays in it.
+        :return: list of encoded messages without headers. Messages are views of buffer, they are valid until next
+        data is received.
+        """
+
+        messages = []
+        message = self.extract_message()
+        while message is not None:
+            messages.append(message)
+            message = self.extract_message()
+        if messages:
+            RECEIVED_MESSAGES.inc(len(messages))
+        return messages
+
+    def get_free_space(self) -> memoryview:
+        """
+        Method returns free space at the end of buffer to receive data into.
+        :return: view of free space.
+        """
+
+        if self._start == self._end:
+            self._start = self._end = 0
+            if len(self._data) > self._initial_size:
+                self._data = bytearray(self._initial_size)
+                self._view = memoryview(self._data)
+        if len(self._data) - self._end < self.MIN_FREE_SPACE or self._start + self._incomplete_message_size > \
+                len(self._data):
+            self._reserve(max(len(self) + self.MIN_FREE_SPACE, self._incomplete_message_size))
+        self._incomplete_message_size = 0
+        return self._view[self._end:]
+
+    def mark_received(self, size: int) -> None:
+        """
+        Method marks data written into free space as received.
+        :param size: size of received data.
         """
 
-        json_message = json.dumps(message)
-        encoded_message = json_message.encode("utf-8")
-        message = struct.pack(">I", len(encoded_message)) + encoded_message
-        while message:
-            sent_num = sock.send(message)
-            message = message[sent_num:]
+        self._end += size
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from connection.messenger import MessageBuffer, Messenger
+from monitoring import metrics
+
+
+CONNECTIONS: metrics.Gauge = metrics.gauge("connections", "Number of open connections")
+CONNECTIONS_TOTAL: metrics.Counter = metrics.counter("connections_total", "Number of connections made")
+DROPPED_MESSAGES: metrics.Counter = metrics.counter("dropped_messages_total",
+                                                    "Number of messages dropped because send queue was full")
+RECEIVE_TIME: metrics.Histogram = metrics.histogram(
+    "receive_seconds", "Time to extract, decode and handle messages after one read of connection", metrics.FAST_BUCKETS)
+RECEIVED_BYTES: metrics.Counter = metrics.counter("received_bytes_total", "Number of bytes received by connections")
+SEND_TIME: metrics.Histogram = metrics.histogram(
+    "send_seconds", "Time to write queued messages of connection to transport", metrics.FAST_BUCKETS)
+SENT_BYTES: metrics.Counter = metrics.counter("sent_bytes_total", "Number of bytes written by connections")
+SENT_MESSAGES: metrics.Counter = metrics.counter("sent_messages_total", "Number of messages queued by connections")
+
+
+class MessageProtocol(asyncio.BufferedProtocol, ABC):
+    """
+    Base class for connection that exchanges messages in format of Messenger. Event loop receives data directly into
+    buffer of connection, subclasses extract and process all complete messages from buffer after every read.
+    Messages are sent in JSON until peer agrees to use newer protocol version in "Hello" message.
+    Messages to send are put in queue of connection, all messages queued during one iteration of event loop are
+    written to socket at once. While transport buffer is full, messages wait in queue. If peer does not read
+    messages and queue exceeds its limit, connection is closed or new messages are dropped, depending on overflow
+    policy.
+    """
+
+    DISCONNECT: str = "disconnect"
+    DROP: str = "drop"
+    MAX_QUEUE_SIZE: int = 1 << 20
+    WRITE_BUFFER_LIMIT: int = 1 << 16
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._address: str = ""
+        self._buffer: MessageBuffer = MessageBuffer()
+        self._dropped_messages_number: int = 0
+        self._flush_scheduled: bool = False
+        self._overflow_policy: str = self.DISCONNECT
+        self._protocol_version: int = Messenger.JSON_PROTOCOL_VERSION
+        self._queue: Deque[bytes] = deque()
+        self._queue_size: int = 0
+        self._transport: Optional[asyncio.Transport] = None
+        self._writing_paused: bool = False
+
+    @property
+    def address(self) -> str:
+        """
+        :return: IP address of remote side of connection.
+        """
+
+        return self._address
+
+    @property
+    def dropped_messages_number(self) -> int:
+        return self._dropped_messages_number
+
+    @property
+    def overflow_policy(self) -> str:
+        """
+        :return: DISCONNECT if connection is closed when send queue is full, DROP if new messages are dropped.
+        """
+
+        return self._overflow_policy
+
+    @overflow_policy.setter
+    def overflow_policy(self, policy: str) -> None:
+        if policy not in (self.DISCONNECT, self.DROP):
+            raise ValueError(f"Unknown overflow policy '{policy}'")
+        self._overflow_policy = policy
+
+    @property
+    def protocol_version(self) -> int:
+        return self._protocol_version
+
+    @property
+    def queue_size(self) -> int:
+        """
+        :return: size in bytes of messages waiting in send queue.
+        """
+
+        return self._queue_size
+
+    def _flush(self) -> None:
+        """
+        Method writes all queued messages to transport with one call.
+        """
+
+        self._flush_scheduled = False
+        if self._writing_paused or not self._queue or not self.is_connected():
+            return
+        start_time = time.perf_counter()
+        self._transport.writelines(self._queue)
+        SEND_TIME.observe(time.perf_counter() - start_time)
+        SENT_BYTES.inc(self._queue_size)
+        self._queue.clear()
+        self._queue_size = 0
+
+    def _handle_overflow(self) -> None:
+        """
+        Method applies overflow policy to message that does not fit in send queue.
+        """
+
+        if self._overflow_policy == self.DROP:
+            self._dropped_messages_number += 1
+            DROPPED_MESSAGES.inc()
+            logging.debug("Send queue of %s is full, message was dropped", self._address)
+            return
+        logging.warning("Send queue of %s is full, connection is closed", self._address)
+        self._queue.clear()
+        self._queue_size = 0
+        self._transport.abort()
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        CONNECTIONS.dec()
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        CONNECTIONS.inc()
+        CONNECTIONS_TOTAL.inc()
+        self._transport = transport
+        transport.set_write_buffer_limits(high=self.WRITE_BUFFER_LIMIT)
+        peer_name = transport.get_extra_info("peername")
+        self._address = str(peer_name[0]) if peer_name else ""
+
+    def buffer_updated(self, nbytes: int) -> None:
+        start_time = time.perf_counter()
+        RECEIVED_BYTES.inc(nbytes)
+        self._buffer.mark_received(nbytes)
+        self.handle_data(self._buffer)
+        RECEIVE_TIME.observe(time.perf_counter() - start_time)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._buffer.get_free_space()
+
+    @abstractmethod
+    def handle_data(self, buffer: MessageBuffer) -> None:
+        """
+        Method processes data in buffer.
+        :param buffer: buffer with received data.
+        """
+
+    def handle_hello(self, message: Dict[str, Any], reply: bool) -> None:
+        """
+        Method handles message in which peer offers protocol version. Both sides use the latest version they
+        support.
+        :param message: "Hello" message;
+        :param reply: if True, agreed version is sent to peer.
+        """
+
+        try:
+            version = min(int(message.get("PROTOCOL", Messenger.JSON_PROTOCOL_VERSION)), Messenger.PROTOCOL_VERSION)
+        except (TypeError, ValueError):
+            version = Messenger.JSON_PROTOCOL_VERSION
+        if reply:
+            self.send_message({"MESSAGE": "Hello", "PROTOCOL": version})
+        self._protocol_version = version
+
+    def is_connected(self) -> bool:
+        return self._transport is not None and not self._transport.is_closing()
+
+    def pause_writing(self) -> None:
+        self._writing_paused = True
+
+    def resume_writing(self) -> None:
+        self._writing_paused = False
+        self._flush()
+
+    def send_encoded_message(self, encoded_message: bytes) -> None:
+        """
+        Method puts encoded message with header in send queue. Queue is flushed in the next iteration of event loop.
+        :param encoded_message: encoded message.
+        """
+
+        if not self.is_connected():
+            return
+        if self._queue_size + len(encoded_message) > self.MAX_QUEUE_SIZE:
+            self._handle_overflow()
+            return
+        self._queue.append(encoded_message)
+        self._queue_size += len(encoded_message)
+        SENT_MESSAGES.inc()
+        if not self._flush_scheduled and not self._writing_paused:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def send_message(self, message: Dict[str, Any]) -> None:
+        """
+        Method sends message to remote side.
+        :param message: message.
+        """
+
+        self.send_encoded_message(Messenger.encode_message(message, self._protocol_version))
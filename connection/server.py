@@ -1,137 +1,281 @@
+import asyncio
+import itertools
 import logging
-import select
-import socket
-from typing import Dict, List
-from PyQt5.QtCore import pyqtSignal, QThread
+import time
+from typing import Any, Callable, Dict, List, Optional
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, QThread
 import connection.params as params
-from connection.messenger import Messenger
-from revealer.utils import get_ip_address
+from connection.live_game import LiveGame
+from connection.messenger import MessageBuffer, Messenger
+from connection.protocol import MessageProtocol
+from monitoring import metrics, profiling, tracing
 
 
 MESSAGE: str = "MESSAGE"
-SOCKET: str = "SOCKET"
+MESSAGE_HANDLING_TIME: metrics.Histogram = metrics.histogram(
+    "server_message_handling_seconds", "Time to decode and process messages received by server in one read",
+    metrics.FAST_BUCKETS)
+
+
+class ClientSession(MessageProtocol):
+    """
+    Class for connection of client to server.
+    """
+
+    def __init__(self, server: "Server", session_id: int) -> None:
+        """
+        :param server: server;
+        :param session_id: ID of session.
+        """
+
+        super().__init__()
+        self._server: Server = server
+        self._session_id: int = session_id
+
+    @property
+    def session_id(self) -> int:
+        return self._session_id
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        super().connection_lost(exc)
+        self._server._remove_session(self)
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        super().connection_made(transport)
+        self._server._add_session(self)
+
+    def handle_data(self, buffer: MessageBuffer) -> None:
+        self._server._get_messages(self, buffer)
 
 
 class Server(QThread):
     """
-    Class for server.
+    Class for server. Server runs asyncio event loop in its thread, so it does not consume CPU while there are no
+    connections or messages, and serves many clients at once.
+    Games played on server side can be broadcast: clients subscribe to game with "Watch" message, get snapshot of
+    game and then every move, which is encoded once for all spectators.
     """
 
-    MAX_CONNECTIONS: int = 5
-    TIMEOUT: float = 0.1
-    challenged: pyqtSignal = pyqtSignal(socket.socket)
+    MAX_CONNECTIONS: int = 1024
+    MAX_LIVE_GAMES: int = 16
+    challenged: pyqtSignal = pyqtSignal(int, str)
+
+    def __init__(self, hosts: Optional[List[str]] = None) -> None:
+        """
+        :param hosts: IP addresses of network interfaces to accept connections on, by default server accepts
+        connections on all interfaces.
+        """
 
-    def __init__(self) -> None:
         super().__init__()
-        self._host: str = get_ip_address()
-        self._port: int = params.PORT
+        self._hosts: Optional[List[str]] = hosts
+        self._handlers: Dict[str, Callable[[ClientSession, Dict[str, Any]], None]] = {
+            "Hello": self._handle_hello,
+            "List games": self._handle_list_games,
+            "Ping": self._handle_ping,
+            "Start game": self._handle_start_game,
+            "Unwatch": self._handle_unwatch,
+            "Watch": self._handle_watch}
+        self._live_games: Dict[int, LiveGame] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._messenger: Messenger = Messenger()
-        self._socket: socket.socket = None
+        self._port: int = params.PORT
+        self._session_ids: itertools.count = itertools.count()
+        self._sessions: Dict[int, ClientSession] = {}
         self._stop: bool = False
 
-    def _process_message(self, message: Dict[str, str], sock: socket.socket, tasks: List[Dict]) -> None:
+    def _add_live_game(self, game_id: int, rows_and_columns: int, win_length: int) -> None:
+        self._live_games[game_id] = LiveGame(game_id, rows_and_columns, win_length)
+        while len(self._live_games) > self.MAX_LIVE_GAMES:
+            del self._live_games[next(iter(self._live_games))]
+
+    def _add_move(self, game_id: int, cell: int, player: int) -> None:
+        live_game = self._live_games.get(game_id)
+        if live_game is not None:
+            live_game.add_move(cell, player)
+
+    def _add_session(self, session: ClientSession) -> None:
+        self._sessions[session.session_id] = session
+        logging.debug("Client %s connected to server", session.address)
+
+    def _call_in_loop(self, callback: Callable, *args) -> None:
+        """
+        Method schedules callback in event loop of server from another thread.
+        :param callback: callback;
+        :param args: arguments of callback.
+        """
+
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except (AttributeError, RuntimeError):
+            logging.debug("Server is not running")
+
+    def _create_session(self) -> ClientSession:
+        return ClientSession(self, next(self._session_ids))
+
+    def _finish_live_game(self, game_id: int, winner: int) -> None:
+        live_game = self._live_games.pop(game_id, None)
+        if live_game is not None:
+            live_game.finish(winner)
+
+    @tracing.traced("Server._get_messages", "connection")
+    @profiling.profiled("messages")
+    def _get_messages(self, session: ClientSession, buffer: MessageBuffer) -> None:
+        """
+        Method decodes complete messages received from client and processes them. Connection with client that sent
+        invalid message is closed.
+        :param session: client session;
+        :param buffer: buffer with data received from client.
+        """
+
+        start_time = time.perf_counter()
+        try:
+            for encoded_message in buffer.extract_messages():
+                self._process_message(self._messenger.decode_message(encoded_message), session)
+        except Exception as exc:
+            logging.debug("Invalid message from client %s: %s", session.address, exc)
+            session.close()
+        MESSAGE_HANDLING_TIME.observe(time.perf_counter() - start_time)
+
+    @staticmethod
+    def _handle_hello(session: ClientSession, message: Dict[str, Any]) -> None:
+        session.handle_hello(message, reply=True)
+
+    def _handle_list_games(self, session: ClientSession, message: Dict[str, Any]) -> None:
+        session.send_message({MESSAGE: "Games", "GAMES": list(self._live_games)})
+
+    @staticmethod
+    def _handle_ping(session: ClientSession, message: Dict[str, Any]) -> None:
+        session.send_message({MESSAGE: "Pong", "TIME": message.get("TIME", 0.0)})
+
+    def _handle_start_game(self, session: ClientSession, message: Dict[str, Any]) -> None:
+        self.challenged.emit(session.session_id, session.address)
+
+    def _handle_unwatch(self, session: ClientSession, message: Dict[str, Any]) -> None:
+        for live_game in self._live_games.values():
+            live_game.remove_spectator(session)
+
+    def _handle_watch(self, session: ClientSession, message: Dict[str, Any]) -> None:
+        """
+        Method subscribes client to game with given ID or to the latest game.
+        :param session: client session;
+        :param message: message from client.
+        """
+
+        game_id = message.get("GAME")
+        if game_id is None and self._live_games:
+            game_id = next(reversed(self._live_games))
+        live_game = self._live_games.get(game_id)
+        if live_game is None:
+            session.send_message({MESSAGE: "Games", "GAMES": list(self._live_games)})
+        else:
+            live_game.add_spectator(session)
+
+    def _process_message(self, message: Dict[str, Any], session: ClientSession) -> None:
         """
         Method processes message from client.
         :param message: message from client;
-        :param sock: client socket;
-        :param tasks: list of tasks for sending messages from server to clients.
+        :param session: client session.
         """
 
-        if message.get("MESSAGE", None) == "Start game":
-            self.challenged.emit(sock)
+        handler = self._handlers.get(message.get(MESSAGE, None))
+        if handler:
+            handler(session, message)
 
-    def _get_messages(self, clients_to_read: List[socket.socket], clients: List[socket.socket], tasks: List[Dict]
-                      ) -> None:
+    def _remove_session(self, session: ClientSession) -> None:
+        self._sessions.pop(session.session_id, None)
+        for live_game in self._live_games.values():
+            live_game.remove_spectator(session)
+        logging.debug("Client %s disconnected from server", session.address)
+
+    def _send_message(self, session_id: int, message: Dict[str, Any]) -> None:
+        session = self._sessions.get(session_id)
+        if session:
+            session.send_message(message)
+
+    @pyqtSlot(int, str)
+    def answer_challenge(self, session_id: int, choice: str) -> None:
         """
-        Method reads messages from clients.
-        :param clients_to_read: list of client sockets to read messages from;
-        :param clients: list of all client sockets;
-        :param tasks: list of tasks for sending messages from server to clients.
+        Slot sends answer to client that called to play online game.
+        :param session_id: ID of client session;
+        :param choice: answer.
         """
 
-        for sock in clients_to_read:
-            try:
-                message = self._messenger.get_message(sock)
-                self._process_message(message, sock, tasks)
-            except Exception:
-                clients.remove(sock)
+        self.send_message(session_id, {MESSAGE: "Start game", "ANSWER": choice})
 
-    def _send_messages(self, clients: List[socket.socket], tasks: List[Dict]) -> None:
+    @pyqtSlot(int, int, int)
+    def broadcast_move(self, game_id: int, cell: int, player: int) -> None:
         """
-        Method sends responses to clients that need it.
-        :param clients: list of all client sockets;
-        :param tasks: list of tasks for sending messages from server to clients.
+        Slot sends move to spectators of game, it can be called from any thread.
+        :param game_id: ID of game;
+        :param cell: index of cell;
+        :param player: index of player.
         """
 
-        while tasks:
-            task = tasks[0]
-            sock = task.get("SOCKET", None)
-            message = task.get("MESSAGE", None)
-            try:
-                self._messenger.send_message(sock, message)
-            except Exception:
-                clients.remove(sock)
-            finally:
-                del tasks[0]
+        self._call_in_loop(self._add_move, game_id, cell, player)
 
     def close_server(self) -> None:
         """
         Method closes server.
         """
 
-        self._socket.close()
+        self._stop = True
+        if self._loop is not None:
+            self._call_in_loop(self._loop.stop)
+        self.wait()
         logging.info("Server was closed")
-        self.quit()
 
-    @staticmethod
-    def get_socket_param(sock: socket.socket) -> str:
+    @pyqtSlot(int, int)
+    def finish_broadcast(self, game_id: int, winner: int) -> None:
         """
-        Method returns socket IP address.
-        :param sock: socket.
-        :return: socket IP address.
+        Slot sends result of game to spectators and stops broadcast of game, it can be called from any thread.
+        :param game_id: ID of game;
+        :param winner: index of winner or -1 in case of draw.
         """
 
-        return str(sock.getpeername())
+        self._call_in_loop(self._finish_live_game, game_id, winner)
 
-    def start_server(self) -> bool:
+    def run(self) -> None:
         """
-        Method starts server on some port.
-        :return: True if server was started.
+        Method runs server.
         """
 
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            server = self._loop.run_until_complete(self._loop.create_server(
+                self._create_session, self._hosts, self._port, backlog=self.MAX_CONNECTIONS))
+        except OSError as exc:
+            logging.error("Server failed to start on port %d: %s", self._port, exc)
+            self._loop.close()
+            return
+        logging.info("Server running on port %d of %s", self._port, ", ".join(self._hosts or ["all interfaces"]))
         try:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._socket.bind((self._host, self._port))
-            self._socket.listen(self.MAX_CONNECTIONS)
-            self._socket.settimeout(self.TIMEOUT)
-            return True
-        except Exception:
-            return False
+            if not self._stop:
+                self._loop.run_forever()
+        finally:
+            server.close()
+            for session in list(self._sessions.values()):
+                session.close()
+            self._loop.run_until_complete(server.wait_closed())
+            self._loop.close()
 
-    def run(self) -> None:
+    def send_message(self, session_id: int, message: Dict[str, Any]) -> None:
         """
-        Method runs server.
+        Method sends message to client, it can be called from any thread.
+        :param session_id: ID of client session;
+        :param message: message.
         """
 
-        if not self.start_server():
-            logging.error("Server failed to start on port %d", self._port)
-            return
-        logging.info("Server running on port %d", self._port)
-        clients = []
-        tasks = []
-        while not self._stop:
-            try:
-                client_socket, _ = self._socket.accept()
-            except OSError:
-                pass
-            else:
-                clients.append(client_socket)
-            finally:
-                clients_to_read = []
-                try:
-                    clients_to_read, _, errors = select.select(clients, clients, [], 0)
-                except Exception:
-                    pass
-                self._get_messages(clients_to_read, clients, tasks)
-                if tasks:
-                    self._send_messages(clients, tasks)
+        self._call_in_loop(self._send_message, session_id, message)
+
+    @pyqtSlot(int, int, int)
+    def start_broadcast(self, game_id: int, rows_and_columns: int, win_length: int) -> None:
+        """
+        Slot starts broadcast of new game, it can be called from any thread. Only the latest MAX_LIVE_GAMES games are
+        broadcast.
+        :param game_id: ID of game;
+        :param rows_and_columns: number of rows and columns on playing field;
+        :param win_length: number of symbols in a row to win.
+        """
+
+        self._call_in_loop(self._add_live_game, game_id, rows_and_columns, win_length)
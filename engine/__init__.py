@@ -0,0 +1,5 @@
+from engine.board import Board
+from engine.search import DIFFICULTIES, SearchEngine
+
+
+__all__ = ["Board", "DIFFICULTIES", "SearchEngine"]
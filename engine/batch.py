@@ -0,0 +1,161 @@
+from typing import Callable, Dict, Optional
+import numpy as np
+from engine.board import Board, get_indexes, get_lines, get_lines_through_cells
+
+
+class BatchSimulator:
+    """
+    Class for simulation of many games at once. Fields of all games are kept in one array and moves are applied to
+    all games that are not finished in one vectorized step. After move only lines through cells of the move are
+    checked for win.
+    In array of fields cell of first player has value 1, cell of second player has value -1, empty cell has value 0.
+    Array has extra cell that is always empty, line made of this cell pads lists of lines through cells to the same
+    length.
+    """
+
+    DRAW: int = -1
+    IN_PROGRESS: int = -2
+
+    def __init__(self, games_number: int, size: int = 3, win_length: Optional[int] = None,
+                 seed: Optional[int] = None) -> None:
+        """
+        :param games_number: number of games;
+        :param size: number of rows and columns on playing field;
+        :param win_length: number of symbols in a row to win, by default it is equal to size;
+        :param seed: seed of random number generator.
+        """
+
+        if win_length is None:
+            win_length = size
+        lines = get_lines(size, win_length)
+        lines_through_cells = get_lines_through_cells(size, win_length)
+        cells_number = size * size
+        self._line_cells: np.ndarray = np.array([get_indexes(line) for line in lines] + [[cells_number] * win_length],
+                                                dtype=np.intp)
+        max_lines_number = max(len(line_numbers) for line_numbers in lines_through_cells)
+        self._cell_lines: np.ndarray = np.full((cells_number, max_lines_number), len(lines), dtype=np.intp)
+        for index, line_numbers in enumerate(lines_through_cells):
+            self._cell_lines[index, :len(line_numbers)] = line_numbers
+        self._cells_number: int = cells_number
+        self._fields: np.ndarray = np.zeros((games_number, cells_number + 1), dtype=np.int8)
+        self._moves_number: int = 0
+        self._random: np.random.Generator = np.random.default_rng(seed)
+        self._results: np.ndarray = np.full(games_number, self.IN_PROGRESS, dtype=np.int8)
+        self._win_length: int = win_length
+
+    @classmethod
+    def from_board(cls, board: Board, games_number: int, seed: Optional[int] = None) -> "BatchSimulator":
+        """
+        Method creates simulator in which all games start from position on board. It can be used for rollouts of
+        position.
+        :param board: board;
+        :param games_number: number of games;
+        :param seed: seed of random number generator.
+        :return: simulator.
+        """
+
+        simulator = cls(games_number, board.size, board.win_length, seed)
+        for index in board.moves:
+            simulator.apply_moves(np.full(games_number, index, dtype=np.intp))
+        return simulator
+
+    @property
+    def fields(self) -> np.ndarray:
+        """
+        :return: array of fields of games with shape (games number, cells number).
+        """
+
+        return self._fields[:, :self._cells_number]
+
+    @property
+    def finished(self) -> np.ndarray:
+        """
+        :return: boolean array, item is True if game is finished.
+        """
+
+        return self._results != self.IN_PROGRESS
+
+    @property
+    def results(self) -> np.ndarray:
+        """
+        :return: array of results of games: index of winner, DRAW or IN_PROGRESS.
+        """
+
+        return self._results
+
+    @property
+    def turn(self) -> int:
+        """
+        :return: index of player to move in all games that are not finished.
+        """
+
+        return self._moves_number % 2
+
+    def apply_moves(self, moves: np.ndarray) -> None:
+        """
+        Method makes moves in all games that are not finished.
+        :param moves: array with index of cell for every game, moves of finished games are ignored.
+        """
+
+        games = np.flatnonzero(self._results == self.IN_PROGRESS)
+        if not len(games):
+            return
+        moves = np.asarray(moves, dtype=np.intp)[games]
+        if np.any((moves < 0) | (moves >= self._cells_number)) or np.any(self._fields[games, moves] != 0):
+            raise ValueError("Moves to occupied cells are not allowed")
+        player = self.turn
+        value = 1 if player == 0 else -1
+        self._fields[games, moves] = value
+        self._moves_number += 1
+
+        line_cells = self._line_cells[self._cell_lines[moves]]
+        line_sums = self._fields[games[:, None, None], line_cells].sum(axis=2, dtype=np.int16)
+        winners = np.any(line_sums == value * self._win_length, axis=1)
+        self._results[games[winners]] = player
+        if self._moves_number == self._cells_number:
+            self._results[self._results == self.IN_PROGRESS] = self.DRAW
+
+    def get_policy_moves(self, policy: Callable[[np.ndarray, int], np.ndarray]) -> np.ndarray:
+        """
+        Method chooses moves in all games with policy. Move with the greatest score among empty cells is chosen.
+        :param policy: function that takes array of fields and index of player to move and returns array of scores
+        of cells with the same shape.
+        :return: array of moves.
+        """
+
+        scores = np.asarray(policy(self.fields, self.turn), dtype=np.float64)
+        scores = np.where(self.fields == 0, scores, -np.inf)
+        return np.argmax(scores, axis=1)
+
+    def get_random_moves(self) -> np.ndarray:
+        """
+        Method chooses random move among empty cells in all games.
+        :return: array of moves.
+        """
+
+        scores = self._random.random(self.fields.shape)
+        scores[self.fields != 0] = -1
+        return np.argmax(scores, axis=1)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Method returns number of games finished with every result.
+        :return: dictionary with number of wins of first and second players, draws and games in progress.
+        """
+
+        return {"first": int(np.count_nonzero(self._results == 0)),
+                "second": int(np.count_nonzero(self._results == 1)),
+                "draw": int(np.count_nonzero(self._results == self.DRAW)),
+                "in_progress": int(np.count_nonzero(self._results == self.IN_PROGRESS))}
+
+    def play(self, policy: Optional[Callable[[np.ndarray, int], np.ndarray]] = None) -> np.ndarray:
+        """
+        Method plays all games to the end.
+        :param policy: function to choose moves (see get_policy_moves), by default moves are random.
+        :return: array of results of games.
+        """
+
+        while np.any(self._results == self.IN_PROGRESS):
+            moves = self.get_random_moves() if policy is None else self.get_policy_moves(policy)
+            self.apply_moves(moves)
+        return self._results
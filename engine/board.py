@@ -0,0 +1,407 @@
+import random
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+@lru_cache(maxsize=None)
+def get_lines(size: int, win_length: int) -> Tuple[int, ...]:
+    """
+    Function returns bit masks of all lines of given length (horizontal, vertical and both diagonal) on playing field
+    of given size. Masks are cached and shared by all boards with the same rules.
+    :param size: number of rows and columns on playing field;
+    :param win_length: number of symbols in a row to win.
+    :return: tuple of line masks.
+    """
+
+    lines = []
+    for row_step, column_step in DIRECTIONS:
+        for row in range(size):
+            for column in range(size):
+                last_row = row + row_step * (win_length - 1)
+                last_column = column + column_step * (win_length - 1)
+                if 0 <= last_row < size and 0 <= last_column < size:
+                    lines.append(sum(1 << ((row + step * row_step) * size + column + step * column_step)
+                                     for step in range(win_length)))
+    return tuple(lines)
+
+
+@lru_cache(maxsize=None)
+def get_lines_through_cells(size: int, win_length: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Function returns for every cell numbers of lines that pass through it.
+    :param size: number of rows and columns on playing field;
+    :param win_length: number of symbols in a row to win.
+    :return: tuple where item with cell index contains numbers of lines in tuple returned by get_lines.
+    """
+
+    lines_through_cells = [[] for _ in range(size * size)]
+    for line_number, line in enumerate(get_lines(size, win_length)):
+        for index in get_indexes(line):
+            lines_through_cells[index].append(line_number)
+    return tuple(tuple(line_numbers) for line_numbers in lines_through_cells)
+
+
+@lru_cache(maxsize=None)
+def get_column_masks(size: int) -> Tuple[int, int]:
+    """
+    Function returns masks that are used to shift bitboard horizontally without wrapping to neighbouring row.
+    :param size: number of rows and columns on playing field.
+    :return: masks of all cells except first column and of all cells except last column.
+    """
+
+    first_column = sum(1 << (row * size) for row in range(size))
+    full_mask = (1 << (size * size)) - 1
+    return full_mask & ~first_column, full_mask & ~(first_column << (size - 1))
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(cells_number: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Function returns random keys for Zobrist hashing of positions. Keys are generated with fixed seed so hashes are
+    the same in all processes.
+    :param cells_number: number of cells on playing field.
+    :return: keys of cells for first and second players.
+    """
+
+    generator = random.Random(cells_number)
+    return (tuple(generator.getrandbits(64) for _ in range(cells_number)),
+            tuple(generator.getrandbits(64) for _ in range(cells_number)))
+
+
+def get_indexes(mask: int) -> List[int]:
+    """
+    Function returns indexes of set bits in mask.
+    :param mask: bit mask.
+    :return: list of indexes in ascending order.
+    """
+
+    indexes = []
+    while mask:
+        low_bit = mask & -mask
+        indexes.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return indexes
+
+
+class Board:
+    """
+    Class for playing field model without any GUI objects. State of field is kept in two integer bitboards, one per
+    player: bit with index row * size + column is set if player has symbol in that cell. Player 0 plays "o" and
+    always moves first. For each line board keeps number of symbols of every player, so move only updates lines that
+    pass through its cell and game over is known without rescanning field. Player wins by lining up win_length
+    symbols horizontally, vertically or diagonally.
+    Board also keeps Zobrist hash of position and score of every player: sum of weights of lines that are not
+    blocked by opponent, weight grows quickly with number of symbols on line.
+    """
+
+    PLAYERS_NUMBER: int = 2
+
+    def __init__(self, size: int = 3, win_length: Optional[int] = None) -> None:
+        """
+        :param size: number of rows and columns on playing field;
+        :param win_length: number of symbols in a row to win, by default it is equal to size.
+        """
+
+        if win_length is None:
+            win_length = size
+        if not 1 <= win_length <= size:
+            raise ValueError(f"Win length {win_length} is not allowed on field {size}x{size}")
+        self._size: int = size
+        self._win_length: int = win_length
+        self._bitboards: List[int] = [0, 0]
+        self._full_mask: int = (1 << (size * size)) - 1
+        self._lines: Tuple[int, ...] = get_lines(size, win_length)
+        self._lines_through_cells: Tuple[Tuple[int, ...], ...] = get_lines_through_cells(size, win_length)
+        self._line_counters: List[List[int]] = [[0] * len(self._lines), [0] * len(self._lines)]
+        self._line_weights: Tuple[int, ...] = tuple(0 if count == 0 else 10 ** (count - 1)
+                                                    for count in range(win_length + 1))
+        self._hash: int = 0
+        self._moves: List[int] = []
+        self._scores: List[int] = [0, 0]
+        self._winning_line: Optional[int] = None
+        self._zobrist_keys: Tuple[Tuple[int, ...], Tuple[int, ...]] = get_zobrist_keys(size * size)
+
+    @property
+    def bitboards(self) -> Tuple[int, int]:
+        """
+        :return: bitboards of first and second players.
+        """
+
+        return self._bitboards[0], self._bitboards[1]
+
+    @property
+    def cells_number(self) -> int:
+        return self._size * self._size
+
+    @property
+    def empty(self) -> int:
+        """
+        :return: bit mask of empty cells.
+        """
+
+        return ~(self._bitboards[0] | self._bitboards[1]) & self._full_mask
+
+    @property
+    def moves(self) -> List[int]:
+        """
+        :return: indexes of cells in order in which moves were made.
+        """
+
+        return list(self._moves)
+
+    @property
+    def occupied(self) -> int:
+        """
+        :return: bit mask of occupied cells.
+        """
+
+        return self._bitboards[0] | self._bitboards[1]
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def hash(self) -> int:
+        """
+        :return: Zobrist hash of position.
+        """
+
+        return self._hash
+
+    @property
+    def last_move(self) -> Optional[int]:
+        """
+        :return: index of cell of last move or None if field is empty.
+        """
+
+        return self._moves[-1] if self._moves else None
+
+    @property
+    def lines(self) -> Tuple[int, ...]:
+        """
+        :return: bit masks of lines on which symbols should be lined up to win.
+        """
+
+        return self._lines
+
+    @property
+    def turn(self) -> int:
+        """
+        :return: index of player to move.
+        """
+
+        return len(self._moves) % self.PLAYERS_NUMBER
+
+    @property
+    def win_length(self) -> int:
+        return self._win_length
+
+    def clear(self) -> None:
+        """
+        Method clears field.
+        """
+
+        self._bitboards = [0, 0]
+        self._line_counters = [[0] * len(self._lines), [0] * len(self._lines)]
+        self._hash = 0
+        self._moves = []
+        self._scores = [0, 0]
+        self._winning_line = None
+
+    def copy(self) -> "Board":
+        """
+        Method returns independent copy of board.
+        :return: copy of board.
+        """
+
+        board = Board(self._size, self._win_length)
+        for index in self._moves:
+            board.make_move(index)
+        return board
+
+    def evaluate(self) -> int:
+        """
+        Method estimates position for player to move.
+        :return: difference between scores of player to move and opponent.
+        """
+
+        player = self.turn
+        return self._scores[player] - self._scores[1 - player]
+
+    def get_candidate_moves(self, radius: int = 1) -> List[int]:
+        """
+        Method returns empty cells that are not farther than given distance from occupied cells. On large fields
+        it is much smaller set of moves than all empty cells. On empty field center cell is returned.
+        :param radius: max distance from occupied cells.
+        :return: list of indexes of cells.
+        """
+
+        if self.is_terminal():
+            return []
+        occupied = self.occupied
+        if not occupied:
+            return [self.get_index(self._size // 2, self._size // 2)]
+        not_first_column, not_last_column = get_column_masks(self._size)
+        neighbourhood = occupied
+        for _ in range(radius):
+            neighbourhood |= ((neighbourhood << 1) & not_first_column) | ((neighbourhood >> 1) & not_last_column)
+            neighbourhood |= (neighbourhood << self._size) | (neighbourhood >> self._size)
+        return get_indexes(neighbourhood & self.empty)
+
+    def get_index(self, row: int, column: int) -> int:
+        """
+        Method returns index of cell.
+        :param row: row of cell;
+        :param column: column of cell.
+        :return: index of cell.
+        """
+
+        return row * self._size + column
+
+    def get_legal_moves(self) -> List[int]:
+        """
+        Method returns indexes of empty cells.
+        :return: list of indexes of cells where move can be made.
+        """
+
+        if self.is_terminal():
+            return []
+        return get_indexes(self.empty)
+
+    def get_move_priority(self, index: int) -> int:
+        """
+        Method estimates how promising move of player to move in given cell is: how much it extends own lines and
+        how much it blocks lines of opponent. It is used to order moves in search.
+        :param index: index of empty cell.
+        :return: priority of move.
+        """
+
+        player = self.turn
+        own_counters = self._line_counters[player]
+        opponent_counters = self._line_counters[1 - player]
+        weights = self._line_weights
+        priority = 0
+        for line_number in self._lines_through_cells[index]:
+            own = own_counters[line_number]
+            opponent = opponent_counters[line_number]
+            if opponent == 0:
+                priority += weights[own + 1]
+            elif own == 0:
+                priority += weights[opponent]
+        return priority
+
+    def get_player(self, index: int) -> Optional[int]:
+        """
+        Method returns player who occupies cell.
+        :param index: index of cell.
+        :return: index of player or None if cell is empty.
+        """
+
+        bit = 1 << index
+        for player, bitboard in enumerate(self._bitboards):
+            if bitboard & bit:
+                return player
+        return None
+
+    def get_position(self, index: int) -> Tuple[int, int]:
+        """
+        Method returns row and column of cell.
+        :param index: index of cell.
+        :return: row and column of cell.
+        """
+
+        return divmod(index, self._size)
+
+    def get_winner(self) -> Optional[int]:
+        """
+        Method returns winner.
+        :return: index of player who lined up symbols or None.
+        """
+
+        if self._winning_line is None:
+            return None
+        return (len(self._moves) - 1) % self.PLAYERS_NUMBER
+
+    def get_winning_line(self) -> Optional[List[int]]:
+        """
+        Method returns cells that are lined up.
+        :return: list of indexes of cells that are lined up or None.
+        """
+
+        if self._winning_line is None:
+            return None
+        return get_indexes(self._lines[self._winning_line])
+
+    def is_empty(self, index: int) -> bool:
+        """
+        Method checks if cell is empty.
+        :param index: index of cell.
+        :return: True if cell is empty.
+        """
+
+        return not self.occupied & (1 << index)
+
+    def is_full(self) -> bool:
+        return len(self._moves) == self.cells_number
+
+    def is_terminal(self) -> bool:
+        """
+        Method checks if game on board is over.
+        :return: True if one of players has won or there are no empty cells.
+        """
+
+        return self._winning_line is not None or self.is_full()
+
+    def make_move(self, index: int) -> None:
+        """
+        Method puts symbol of player to move in cell.
+        :param index: index of cell.
+        """
+
+        if self._winning_line is not None or not 0 <= index < self.cells_number or not self.is_empty(index):
+            raise ValueError(f"Move to cell {index} is not allowed")
+        player = self.turn
+        self._bitboards[player] |= 1 << index
+        self._hash ^= self._zobrist_keys[player][index]
+        self._moves.append(index)
+        own_counters = self._line_counters[player]
+        opponent_counters = self._line_counters[1 - player]
+        weights = self._line_weights
+        for line_number in self._lines_through_cells[index]:
+            own = own_counters[line_number]
+            opponent = opponent_counters[line_number]
+            if opponent == 0:
+                self._scores[player] += weights[own + 1] - weights[own]
+            elif own == 0:
+                self._scores[1 - player] -= weights[opponent]
+            own_counters[line_number] = own + 1
+            if own + 1 == self._win_length:
+                self._winning_line = line_number
+
+    def unmake_move(self) -> int:
+        """
+        Method takes back last move.
+        :return: index of cell that was freed.
+        """
+
+        index = self._moves.pop()
+        player = self.turn
+        self._bitboards[player] &= ~(1 << index)
+        self._hash ^= self._zobrist_keys[player][index]
+        own_counters = self._line_counters[player]
+        opponent_counters = self._line_counters[1 - player]
+        weights = self._line_weights
+        for line_number in self._lines_through_cells[index]:
+            own = own_counters[line_number] - 1
+            opponent = opponent_counters[line_number]
+            if opponent == 0:
+                self._scores[player] -= weights[own + 1] - weights[own]
+            elif own == 0:
+                self._scores[1 - player] += weights[opponent]
+            own_counters[line_number] = own
+        self._winning_line = None
+        return index
@@ -0,0 +1,232 @@
+import logging
+import math
+import random
+import time
+from typing import List, Optional, Tuple
+from engine.board import Board, get_indexes
+
+
+class MctsNode:
+    """
+    Class for node of Monte-Carlo search tree.
+    """
+
+    __slots__ = ("children", "move", "parent", "untried_moves", "visits", "wins")
+
+    def __init__(self, move: Optional[int], parent: Optional["MctsNode"], untried_moves: List[int]) -> None:
+        """
+        :param move: move that leads to node from parent node;
+        :param parent: parent node;
+        :param untried_moves: moves for which child nodes were not created yet.
+        """
+
+        self.children: List[MctsNode] = []
+        self.move: Optional[int] = move
+        self.parent: Optional[MctsNode] = parent
+        self.untried_moves: List[int] = untried_moves
+        self.visits: int = 0
+        self.wins: float = 0
+
+    def find_child(self, move: int) -> Optional["MctsNode"]:
+        """
+        Method returns child node for given move.
+        :param move: move.
+        :return: child node or None if it was not created.
+        """
+
+        for child in self.children:
+            if child.move == move:
+                return child
+        return None
+
+    def select_child(self, exploration: float) -> "MctsNode":
+        """
+        Method selects child node with the greatest upper confidence bound (UCT).
+        :param exploration: exploration constant.
+        :return: child node.
+        """
+
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.wins / child.visits +
+                   exploration * math.sqrt(log_visits / child.visits))
+
+
+class MctsEngine:
+    """
+    Class for search of move with Monte-Carlo tree search. Tree is grown with UCT selection and positions are
+    estimated with fast playouts on board until time or playout budget is exhausted. Subtree of the position that
+    is reached after the next moves is reused in the next search.
+    Playouts are random or heuristic: in heuristic playout move is usually made next to the previous move.
+    """
+
+    EXPLORATION: float = 1.4
+    NEIGHBOUR_MOVE_PROBABILITY: float = 0.8
+    SMALL_FIELD_SIZE: int = 5
+    TIME_LIMIT: float = 1.0
+    _NEIGHBOUR_STEPS: Tuple[Tuple[int, int], ...] = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0),
+                                                     (1, 1))
+
+    def __init__(self, time_limit: float = TIME_LIMIT, playout_limit: Optional[int] = None,
+                 exploration: float = EXPLORATION, heuristic_playouts: bool = True) -> None:
+        """
+        :param time_limit: max time in seconds to search move;
+        :param playout_limit: max number of playouts to search move, by default number is not limited;
+        :param exploration: exploration constant of UCT;
+        :param heuristic_playouts: if True, playouts are heuristic, otherwise they are random.
+        """
+
+        self._exploration: float = exploration
+        self._heuristic_playouts: bool = heuristic_playouts
+        self._last_playouts: int = 0
+        self._last_playouts_per_second: float = 0
+        self._playout_limit: Optional[int] = playout_limit
+        self._root: Optional[MctsNode] = None
+        self._root_moves: List[int] = []
+        self._root_rules: Tuple[int, int] = 0, 0
+        self._time_limit: float = time_limit
+
+    @property
+    def last_playouts(self) -> int:
+        """
+        :return: number of playouts in previous search.
+        """
+
+        return self._last_playouts
+
+    @property
+    def last_playouts_per_second(self) -> float:
+        """
+        :return: speed of playouts in previous search.
+        """
+
+        return self._last_playouts_per_second
+
+    def _create_node(self, board: Board, move: Optional[int], parent: Optional[MctsNode]) -> MctsNode:
+        """
+        Method creates node for position on board. On large fields only cells next to occupied cells are considered
+        as moves.
+        :param board: board;
+        :param move: move that leads to position;
+        :param parent: parent node.
+        :return: node.
+        """
+
+        if board.size <= self.SMALL_FIELD_SIZE:
+            moves = board.get_legal_moves()
+        else:
+            moves = board.get_candidate_moves()
+        random.shuffle(moves)
+        moves.sort(key=board.get_move_priority)
+        return MctsNode(move, parent, moves)
+
+    def _get_root(self, board: Board) -> MctsNode:
+        """
+        Method returns root node for position on board. If position was reached from root of previous search, its
+        subtree is reused.
+        :param board: board.
+        :return: root node.
+        """
+
+        moves = board.moves
+        rules = board.size, board.win_length
+        node = self._root
+        if node is not None and rules == self._root_rules and moves[:len(self._root_moves)] == self._root_moves:
+            for move in moves[len(self._root_moves):]:
+                node = node.find_child(move)
+                if node is None:
+                    break
+        else:
+            node = None
+        if node is None:
+            node = self._create_node(board, None, None)
+        node.parent = None
+        self._root = node
+        self._root_moves = moves
+        self._root_rules = rules
+        return node
+
+    def _playout(self, board: Board) -> int:
+        """
+        Method plays game on board to the end.
+        :param board: board.
+        :return: number of moves made in playout.
+        """
+
+        moves_number = 0
+        empty_cells = get_indexes(board.empty)
+        random.shuffle(empty_cells)
+        size = board.size
+        while not board.is_terminal():
+            move = None
+            last_move = board.last_move
+            if self._heuristic_playouts and last_move is not None and \
+                    random.random() < self.NEIGHBOUR_MOVE_PROBABILITY:
+                row, column = divmod(last_move, size)
+                row_step, column_step = random.choice(self._NEIGHBOUR_STEPS)
+                row += row_step
+                column += column_step
+                if 0 <= row < size and 0 <= column < size and board.is_empty(row * size + column):
+                    move = row * size + column
+            while move is None:
+                move = empty_cells.pop()
+                if not board.is_empty(move):
+                    move = None
+            board.make_move(move)
+            moves_number += 1
+        return moves_number
+
+    def clear(self) -> None:
+        """
+        Method forgets search tree.
+        """
+
+        self._root = None
+        self._root_moves = []
+
+    def find_move(self, board: Board) -> int:
+        """
+        Method searches move for player to move.
+        :param board: board with current position, it is not changed.
+        :return: index of cell to make move.
+        """
+
+        if board.is_terminal():
+            raise ValueError("There are no moves on finished field")
+        board = board.copy()
+        root = self._get_root(board)
+        start_time = time.perf_counter()
+        deadline = start_time + self._time_limit
+        playouts = 0
+        while (self._playout_limit is None or playouts < self._playout_limit) and \
+                (playouts == 0 or time.perf_counter() < deadline):
+            node = root
+            path = [root]
+            while not node.untried_moves and node.children:
+                node = node.select_child(self._exploration)
+                board.make_move(node.move)
+                path.append(node)
+            if node.untried_moves:
+                move = node.untried_moves.pop()
+                board.make_move(move)
+                child = self._create_node(board, move, node)
+                node.children.append(child)
+                path.append(child)
+            moves_number = len(path) - 1 + self._playout(board)
+            winner = board.get_winner()
+            for _ in range(moves_number):
+                board.unmake_move()
+            root.visits += 1
+            player = board.turn
+            for node in path[1:]:
+                node.visits += 1
+                if winner is None:
+                    node.wins += 0.5
+                elif winner == player:
+                    node.wins += 1
+                player = 1 - player
+            playouts += 1
+        elapsed = time.perf_counter() - start_time
+        self._last_playouts = playouts
+        self._last_playouts_per_second = playouts / elapsed if elapsed > 0 else 0
+        logging.debug("MCTS made %d playouts, %.0f playouts per second", playouts, self._last_playouts_per_second)
+        return max(root.children, key=lambda child: child.visits).move
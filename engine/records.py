@@ -0,0 +1,261 @@
+import logging
+import mmap
+import os
+import struct
+from array import array
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+
+DEFAULT_PATH: str = os.path.join(os.path.expanduser("~"), ".tic-tac-toe", "games.bin")
+PLAYER_TYPES: Tuple[str, ...] = ("human", "search", "mcts", "remote", "random", "table")
+
+
+class GameRecord(NamedTuple):
+    """
+    Record of finished game. Winner is None in case of draw, players are types from PLAYER_TYPES, moves are indexes
+    of cells, timestamp is time of game in seconds since epoch.
+    """
+
+    size: int
+    win_length: int
+    winner: Optional[int]
+    players: Tuple[str, str]
+    moves: Tuple[int, ...]
+    timestamp: int
+
+
+class GameRecordFormat:
+    """
+    Format of file with records of games. File consists of header and records of games appended one after another.
+    Record consists of fixed header with time of game, size of field, number of symbols in a row to win, winner,
+    types of players, number of moves and size of moves, then moves follow. Move is one byte if field has no more
+    than 256 cells, otherwise it is unsigned varint: 7 bits in every byte, high bit is set in all bytes except last.
+    """
+
+    DRAW: int = -1
+    HEADER: struct.Struct = struct.Struct(">4sB")
+    MAGIC: bytes = b"TTTR"
+    RECORD_HEADER: struct.Struct = struct.Struct(">IBBbBBHH")
+    VERSION: int = 1
+
+    @staticmethod
+    def decode_moves(data: bytes, size: int, moves_number: int) -> Tuple[int, ...]:
+        """
+        Method decodes moves of game.
+        :param data: encoded moves;
+        :param size: number of rows and columns on playing field;
+        :param moves_number: number of moves.
+        :return: indexes of cells of moves.
+        """
+
+        if size * size <= 256:
+            if len(data) != moves_number:
+                raise ValueError("Moves of game record are corrupted")
+            return tuple(data)
+        moves = []
+        value = shift = 0
+        for byte in data:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                moves.append(value)
+                value = shift = 0
+        if len(moves) != moves_number:
+            raise ValueError("Moves of game record are corrupted")
+        return tuple(moves)
+
+    @classmethod
+    def get_record_end(cls, data: bytes, offset: int) -> Optional[int]:
+        """
+        Method returns end of record that starts at offset.
+        :param data: content of file with records;
+        :param offset: offset of record.
+        :return: offset of the end of record or None if there is no complete record at offset.
+        """
+
+        if offset + cls.RECORD_HEADER.size > len(data):
+            return None
+        moves_size = cls.RECORD_HEADER.unpack_from(data, offset)[-1]
+        end = offset + cls.RECORD_HEADER.size + moves_size
+        return end if end <= len(data) else None
+
+    @staticmethod
+    def encode_moves(moves: Tuple[int, ...], size: int) -> bytes:
+        """
+        Method encodes moves of game.
+        :param moves: indexes of cells of moves;
+        :param size: number of rows and columns on playing field.
+        :return: encoded moves.
+        """
+
+        if size * size <= 256:
+            return bytes(moves)
+        data = bytearray()
+        for move in moves:
+            while move >= 0x80:
+                data.append(move & 0x7F | 0x80)
+                move >>= 7
+            data.append(move)
+        return bytes(data)
+
+    @classmethod
+    def encode_record(cls, record: GameRecord) -> bytes:
+        """
+        Method encodes record of game.
+        :param record: record of game.
+        :return: encoded record.
+        """
+
+        moves = cls.encode_moves(record.moves, record.size)
+        winner = cls.DRAW if record.winner is None else record.winner
+        header = cls.RECORD_HEADER.pack(record.timestamp, record.size, record.win_length, winner,
+                                        *(PLAYER_TYPES.index(player) for player in record.players),
+                                        len(record.moves), len(moves))
+        return header + moves
+
+
+class GameRecordWriter:
+    """
+    Class for writing records of finished games to the end of file. Every record is written with one call, so
+    records written before are never changed. If the last record was not written completely, it is cut off when
+    file is opened, so new records do not follow torn one.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        """
+        :param path: path to file with records, file and its directory are created if needed.
+        """
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(GameRecordFormat.HEADER.pack(GameRecordFormat.MAGIC, GameRecordFormat.VERSION))
+            self._file.flush()
+        else:
+            with open(path, "rb") as file:
+                header = file.read(GameRecordFormat.HEADER.size)
+            if header != GameRecordFormat.HEADER.pack(GameRecordFormat.MAGIC, GameRecordFormat.VERSION):
+                self._file.close()
+                raise ValueError(f"File '{path}' is not file with records of games")
+            self._cut_torn_record(path)
+
+    def _cut_torn_record(self, path: str) -> None:
+        """
+        Method truncates file after the last complete record.
+        :param path: path to file with records.
+        """
+
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = len(data)
+            offset = GameRecordFormat.HEADER.size
+            end = GameRecordFormat.get_record_end(data, offset)
+            while end is not None:
+                offset = end
+                end = GameRecordFormat.get_record_end(data, offset)
+        if offset < size:
+            logging.warning("Torn record of game of %d bytes was cut off from file '%s'", size - offset, path)
+            self._file.truncate(offset)
+
+    def __enter__(self) -> "GameRecordWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def write(self, record: GameRecord) -> None:
+        """
+        Method appends record of game to file.
+        :param record: record of game.
+        """
+
+        self._file.write(GameRecordFormat.encode_record(record))
+        self._file.flush()
+
+
+class GameRecordReader:
+    """
+    Class for reading records of games from memory-mapped file. Records are decoded only when they are requested, so
+    files with millions of games are not loaded in memory. To access records by index, offsets of records are found
+    once by reading their headers.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        """
+        :param path: path to file with records.
+        """
+
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < GameRecordFormat.HEADER.size:
+                raise ValueError(f"File '{path}' is not file with records of games")
+            self._data: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if GameRecordFormat.HEADER.unpack_from(self._data) != (GameRecordFormat.MAGIC, GameRecordFormat.VERSION):
+            self._data.close()
+            raise ValueError(f"File '{path}' is not file with records of games")
+        self._offsets: Optional[array] = None
+
+    def __enter__(self) -> "GameRecordReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __getitem__(self, index: int) -> GameRecord:
+        offsets = self._get_offsets()
+        return self._read_record(offsets[index])[0]
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        offset = GameRecordFormat.HEADER.size
+        while True:
+            result = self._read_record(offset)
+            if result is None:
+                return
+            record, offset = result
+            yield record
+
+    def __len__(self) -> int:
+        return len(self._get_offsets())
+
+    def _get_offsets(self) -> array:
+        """
+        Method finds offsets of all complete records in file.
+        :return: array of offsets.
+        """
+
+        if self._offsets is None:
+            self._offsets = array("Q")
+            offset = GameRecordFormat.HEADER.size
+            end = GameRecordFormat.get_record_end(self._data, offset)
+            while end is not None:
+                self._offsets.append(offset)
+                offset = end
+                end = GameRecordFormat.get_record_end(self._data, offset)
+        return self._offsets
+
+    def _read_record(self, offset: int) -> Optional[Tuple[GameRecord, int]]:
+        """
+        Method decodes record that starts at offset.
+        :param offset: offset of record.
+        :return: record and offset of next record or None if there is no complete record at offset.
+        """
+
+        end = GameRecordFormat.get_record_end(self._data, offset)
+        if end is None:
+            return None
+        timestamp, size, win_length, winner, first, second, moves_number, _ = \
+            GameRecordFormat.RECORD_HEADER.unpack_from(self._data, offset)
+        if first >= len(PLAYER_TYPES) or second >= len(PLAYER_TYPES):
+            raise ValueError("Types of players of game record are corrupted")
+        moves = GameRecordFormat.decode_moves(self._data[offset + GameRecordFormat.RECORD_HEADER.size:end], size,
+                                              moves_number)
+        record = GameRecord(size, win_length, None if winner == GameRecordFormat.DRAW else winner,
+                            (PLAYER_TYPES[first], PLAYER_TYPES[second]), moves, timestamp)
+        return record, end
+
+    def close(self) -> None:
+        self._data.close()
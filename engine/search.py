@@ -0,0 +1,289 @@
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from engine.board import Board
+
+
+class Difficulty(NamedTuple):
+    """
+    Search parameters for difficulty level.
+    """
+
+    max_depth: int
+    time_limit: float
+    random_move_probability: float
+
+
+DIFFICULTIES: Dict[str, Difficulty] = {"easy": Difficulty(1, 0.05, 0.3),
+                                       "medium": Difficulty(3, 0.2, 0.0),
+                                       "hard": Difficulty(64, 0.5, 0.0)}
+
+
+class SearchAborted(Exception):
+    """
+    Exception is raised when search runs out of time or node budget.
+    """
+
+
+class SearchEngine:
+    """
+    Class for search of best move with negamax algorithm and alpha-beta pruning. Search deepens iteratively until max
+    depth, time budget or node budget is reached, and move of the last completed iteration is returned. Results of
+    searched positions are kept in transposition table of fixed size indexed by Zobrist hash of position.
+    """
+
+    CHECK_INTERVAL: int = 256
+    EXACT: int = 0
+    LOWER_BOUND: int = 1
+    SMALL_FIELD_SIZE: int = 5
+    TABLE_SIZE: int = 1 << 16
+    UPPER_BOUND: int = 2
+    WIN_SCORE: int = 1 << 40
+    WIN_THRESHOLD: int = WIN_SCORE - (1 << 20)
+
+    def __init__(self, difficulty: str = "hard", time_limit: Optional[float] = None, node_limit: Optional[int] = None,
+                 table_size: int = TABLE_SIZE) -> None:
+        """
+        :param difficulty: name of difficulty level from DIFFICULTIES;
+        :param time_limit: max time in seconds to search move, by default it is taken from difficulty level;
+        :param node_limit: max number of positions to search for move, by default number is not limited;
+        :param table_size: number of entries in transposition table, should be power of two.
+        """
+
+        parameters = DIFFICULTIES[difficulty]
+        self._deadline: float = 0
+        self._last_depth: int = 0
+        self._last_nodes: int = 0
+        self._max_depth: int = parameters.max_depth
+        self._next_check: int = 0
+        self._node_limit: Optional[int] = node_limit
+        self._nodes: int = 0
+        self._random_move_probability: float = parameters.random_move_probability
+        self._table: List[Optional[Tuple[int, int, int, int, int]]] = [None] * table_size
+        self._table_mask: int = table_size - 1
+        self._time_limit: float = parameters.time_limit if time_limit is None else time_limit
+
+    @property
+    def last_depth(self) -> int:
+        """
+        :return: depth of the last completed iteration of previous search.
+        """
+
+        return self._last_depth
+
+    @property
+    def last_nodes(self) -> int:
+        """
+        :return: number of positions visited in previous search.
+        """
+
+        return self._last_nodes
+
+    def _check_budget(self) -> None:
+        """
+        Method aborts search if time or node budget is exhausted.
+        """
+
+        self._next_check = self._nodes + self.CHECK_INTERVAL
+        if time.perf_counter() >= self._deadline or (self._node_limit is not None and
+                                                     self._nodes >= self._node_limit):
+            raise SearchAborted()
+
+    def _get_ordered_moves(self, board: Board, first_move: Optional[int] = None) -> List[int]:
+        """
+        Method returns moves in order in which they should be searched: given move first, then moves with higher
+        priority. On large fields only cells next to occupied cells are considered.
+        :param board: board;
+        :param first_move: move to be searched first.
+        :return: list of moves.
+        """
+
+        if board.size <= self.SMALL_FIELD_SIZE:
+            moves = board.get_legal_moves()
+        else:
+            moves = board.get_candidate_moves()
+        moves.sort(key=board.get_move_priority, reverse=True)
+        if first_move is not None and first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        return moves
+
+    def _negamax(self, board: Board, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """
+        Method searches position.
+        :param board: board;
+        :param depth: remaining depth of search;
+        :param alpha: lower bound of score;
+        :param beta: upper bound of score;
+        :param ply: number of moves from root of search.
+        :return: score of position for player to move.
+        """
+
+        self._nodes += 1
+        if self._nodes >= self._next_check:
+            self._check_budget()
+        if board.get_winner() is not None:
+            return ply - self.WIN_SCORE
+        if board.is_full():
+            return 0
+        if depth == 0:
+            return board.evaluate()
+
+        original_alpha = alpha
+        table_move, alpha, beta = self._probe_table(board, depth, alpha, beta, ply)
+        if alpha >= beta:
+            return alpha
+
+        best_score = -self.WIN_SCORE
+        best_move = None
+        for move in self._get_ordered_moves(board, table_move):
+            board.make_move(move)
+            score = -self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
+            board.unmake_move()
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            flag = self.UPPER_BOUND
+        elif best_score >= beta:
+            flag = self.LOWER_BOUND
+        else:
+            flag = self.EXACT
+        self._save_to_table(board, depth, best_score, flag, best_move, ply)
+        return best_score
+
+    def _probe_table(self, board: Board, depth: int, alpha: int, beta: int, ply: int
+                     ) -> Tuple[Optional[int], int, int]:
+        """
+        Method looks up position in transposition table and narrows bounds of score with saved result.
+        :param board: board;
+        :param depth: remaining depth of search;
+        :param alpha: lower bound of score;
+        :param beta: upper bound of score;
+        :param ply: number of moves from root of search.
+        :return: best move saved for position (or None), new lower and upper bounds of score. If lower bound is not
+        less than upper bound, score of position is lower bound.
+        """
+
+        entry = self._table[board.hash & self._table_mask]
+        if entry is None or entry[0] != board.hash:
+            return None, alpha, beta
+        _, entry_depth, entry_score, entry_flag, table_move = entry
+        if entry_depth >= depth:
+            score = self._score_from_table(entry_score, ply)
+            if entry_flag == self.EXACT:
+                return table_move, score, score
+            if entry_flag == self.LOWER_BOUND:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return table_move, score, score
+        return table_move, alpha, beta
+
+    def _save_to_table(self, board: Board, depth: int, score: int, flag: int, move: Optional[int], ply: int) -> None:
+        """
+        Method saves result of search of position in transposition table. Entry of the same position is replaced only
+        by result of search that is not shallower.
+        :param board: board;
+        :param depth: depth of search;
+        :param score: score of position;
+        :param flag: EXACT if score is exact, LOWER_BOUND or UPPER_BOUND if score is bound;
+        :param move: best move;
+        :param ply: number of moves from root of search.
+        """
+
+        table_index = board.hash & self._table_mask
+        entry = self._table[table_index]
+        if entry is None or entry[0] != board.hash or entry[1] <= depth:
+            self._table[table_index] = board.hash, depth, self._score_to_table(score, ply), flag, move
+
+    def _score_from_table(self, score: int, ply: int) -> int:
+        """
+        Method converts score of won or lost position from transposition table, where distance to the end of game is
+        counted from the position itself, to score relative to root of search.
+        :param score: score from table;
+        :param ply: number of moves from root of search.
+        :return: score.
+        """
+
+        if score >= self.WIN_THRESHOLD:
+            return score - ply
+        if score <= -self.WIN_THRESHOLD:
+            return score + ply
+        return score
+
+    def _score_to_table(self, score: int, ply: int) -> int:
+        """
+        Method converts score relative to root of search to score to be saved in transposition table.
+        :param score: score;
+        :param ply: number of moves from root of search.
+        :return: score for table.
+        """
+
+        if score >= self.WIN_THRESHOLD:
+            return score + ply
+        if score <= -self.WIN_THRESHOLD:
+            return score - ply
+        return score
+
+    def _search_root(self, board: Board, depth: int, first_move: int) -> Tuple[int, int]:
+        """
+        Method searches moves from root position.
+        :param board: board;
+        :param depth: depth of search;
+        :param first_move: move to be searched first.
+        :return: score and best move.
+        """
+
+        alpha = -self.WIN_SCORE
+        best_move = first_move
+        for move in self._get_ordered_moves(board, first_move):
+            board.make_move(move)
+            score = -self._negamax(board, depth - 1, -self.WIN_SCORE, -alpha, 1)
+            board.unmake_move()
+            if score > alpha:
+                alpha = score
+                best_move = move
+        return alpha, best_move
+
+    def clear(self) -> None:
+        """
+        Method clears transposition table.
+        """
+
+        self._table = [None] * len(self._table)
+
+    def find_move(self, board: Board) -> int:
+        """
+        Method searches best move for player to move.
+        :param board: board with current position, it is not changed.
+        :return: index of cell to make move.
+        """
+
+        board = board.copy()
+        moves = self._get_ordered_moves(board)
+        if not moves:
+            raise ValueError("There are no moves on finished field")
+        if random.random() < self._random_move_probability:
+            return random.choice(moves)
+
+        self._deadline = time.perf_counter() + self._time_limit
+        self._last_depth = 0
+        self._next_check = self.CHECK_INTERVAL
+        self._nodes = 0
+        best_move = moves[0]
+        for depth in range(1, min(self._max_depth, len(board.get_legal_moves())) + 1):
+            try:
+                score, best_move = self._search_root(board, depth, best_move)
+            except SearchAborted:
+                break
+            self._last_depth = depth
+            if abs(score) >= self.WIN_THRESHOLD:
+                break
+        self._last_nodes = self._nodes
+        return best_move
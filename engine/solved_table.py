@@ -0,0 +1,162 @@
+import logging
+import mmap
+import os
+import struct
+import sys
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from engine.board import Board, get_indexes
+
+
+DEFAULT_PATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "media",
+                                 "solved_3x3.bin")
+
+
+class SolvedTable:
+    """
+    Class for reading table of solved positions of classic 3x3 game. Table is memory-mapped file, so it is loaded
+    instantly and all processes share the same read-only pages.
+    File consists of header and one byte per position. Position index is number in ternary system in which digit of
+    cell is 0 for empty cell, 1 for cell of first player and 2 for cell of second player. Lower 4 bits of byte are best
+    move for player to move and next 2 bits are outcome of game with perfect play.
+    """
+
+    DRAW: int = 0
+    HEADER: struct.Struct = struct.Struct(">4sBBB")
+    LOSS: int = 2
+    MAGIC: bytes = b"TTTS"
+    NO_MOVE: int = 0x0F
+    SIZE: int = 3
+    UNREACHABLE: int = 0xFF
+    VERSION: int = 1
+    WIN: int = 1
+    _TERNARY: Tuple[int, ...] = tuple(sum(3 ** index for index in get_indexes(mask)) for mask in range(1 << 9))
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        """
+        :param path: path to file with table.
+        """
+
+        with open(path, "rb") as file:
+            self._data: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._data) != self.HEADER.size + 3 ** (self.SIZE * self.SIZE) or \
+                self.HEADER.unpack_from(self._data) != (self.MAGIC, self.VERSION, self.SIZE, self.SIZE):
+            self._data.close()
+            raise ValueError(f"File '{path}' is not table of solved positions")
+
+    @classmethod
+    def get_index(cls, board: Board) -> int:
+        """
+        Method returns index of position in table.
+        :param board: board.
+        :return: index of position.
+        """
+
+        first_bitboard, second_bitboard = board.bitboards
+        return cls._TERNARY[first_bitboard] + 2 * cls._TERNARY[second_bitboard]
+
+    @classmethod
+    def is_applicable(cls, board: Board) -> bool:
+        """
+        Method checks that table can be used for board.
+        :param board: board.
+        :return: True if board has rules of classic game.
+        """
+
+        return board.size == cls.SIZE and board.win_length == cls.SIZE
+
+    def close(self) -> None:
+        self._data.close()
+
+    def get_entry(self, board: Board) -> Optional[Tuple[Optional[int], int]]:
+        """
+        Method returns best move and outcome of position.
+        :param board: board.
+        :return: best move (None for finished game) and outcome for player to move or None if position is unreachable.
+        """
+
+        entry = self._data[self.HEADER.size + self.get_index(board)]
+        if entry == self.UNREACHABLE:
+            return None
+        move = entry & 0x0F
+        return None if move == self.NO_MOVE else move, entry >> 4
+
+    def get_move(self, board: Board) -> Optional[int]:
+        """
+        Method returns best move for player to move.
+        :param board: board.
+        :return: index of cell or None if there is no move in table.
+        """
+
+        entry = self.get_entry(board)
+        return None if entry is None else entry[0]
+
+
+def _solve(board: Board, solved: Dict[int, Tuple[int, int]]) -> int:
+    """
+    Function solves position and all positions reachable from it.
+    :param board: board;
+    :param solved: dictionary with indexes of solved positions, their scores and table entries.
+    :return: score of position for player to move, score is positive for win and negative for loss, faster win has
+    greater score.
+    """
+
+    index = SolvedTable.get_index(board)
+    if index in solved:
+        return solved[index][0]
+    best_move = SolvedTable.NO_MOVE
+    if board.get_winner() is not None:
+        score = len(board.moves) - board.cells_number - 1
+    elif board.is_full():
+        score = 0
+    else:
+        score = None
+        for move in board.get_legal_moves():
+            board.make_move(move)
+            move_score = -_solve(board, solved)
+            board.unmake_move()
+            if score is None or move_score > score:
+                score = move_score
+                best_move = move
+    outcome = SolvedTable.WIN if score > 0 else SolvedTable.LOSS if score < 0 else SolvedTable.DRAW
+    solved[index] = score, outcome << 4 | best_move
+    return score
+
+
+def build_table(path: str = DEFAULT_PATH) -> int:
+    """
+    Function solves all reachable positions of classic 3x3 game and writes table of solved positions to file.
+    :param path: path to file.
+    :return: number of reachable positions.
+    """
+
+    solved = {}
+    _solve(Board(SolvedTable.SIZE), solved)
+    data = bytearray([SolvedTable.UNREACHABLE]) * 3 ** (SolvedTable.SIZE * SolvedTable.SIZE)
+    for index, (_, entry) in solved.items():
+        data[index] = entry
+    with open(path, "wb") as file:
+        file.write(SolvedTable.HEADER.pack(SolvedTable.MAGIC, SolvedTable.VERSION, SolvedTable.SIZE, SolvedTable.SIZE))
+        file.write(data)
+    return len(solved)
+
+
+@lru_cache(maxsize=None)
+def load_solved_table(path: str = DEFAULT_PATH) -> Optional[SolvedTable]:
+    """
+    Function opens table of solved positions once per process.
+    :param path: path to file with table.
+    :return: table or None if file does not exist or is damaged.
+    """
+
+    try:
+        return SolvedTable(path)
+    except (OSError, ValueError) as exc:
+        logging.warning("Table of solved positions was not loaded: %s", exc)
+        return None
+
+
+if __name__ == "__main__":
+    table_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    positions_number = build_table(table_path)
+    print(f"Table of {positions_number} solved positions was written to '{table_path}'")
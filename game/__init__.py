@@ -1,5 +1,5 @@
 from game.game import Game
-from game.player import ComputerPlayer, Player
-from game.playing_field import Cell, PlayingField
+from game.player import ComputerPlayer, MctsComputerPlayer, Player
+from game.playing_field import PlayingField
 
-__all__ = ["Cell", "ComputerPlayer", "Game", "Player", "PlayingField"]
+__all__ = ["ComputerPlayer", "Game", "MctsComputerPlayer", "Player", "PlayingField"]
@@ -1,25 +1,62 @@
-from typing import List
+import logging
+import time
+from typing import List, Optional, Set
 from PyQt5.QtCore import pyqtSignal, pyqtSlot, QObject
-from PyQt5.QtWidgets import QPushButton
+from engine.records import GameRecord, GameRecordWriter
+from game.move_search import MoveSearch
 from game.player import ComputerPlayer, Player
-from game.playing_field import Cell, PlayingField
+from game.playing_field import PlayingField
+from gui.board_widget import BoardWidget
+from monitoring import metrics, tracing
+
+
+GAMES_FINISHED: metrics.Counter = metrics.counter("games_finished_total", "Number of finished games")
+GAMES_STARTED: metrics.Counter = metrics.counter("games_started_total", "Number of started games")
+MOVES: metrics.Counter = metrics.counter("moves_total", "Number of moves made")
 
 
 class Game(QObject):
     """
-    Class is responsible for game.
+    Class is responsible for game. Computer player chooses move in separate thread, clicks on playing field are
+    ignored until computer makes move.
     """
 
     ROWS_AND_COLUMNS: int = 3
+    WIN_LENGTH: int = 3
+    game_finished: pyqtSignal = pyqtSignal(int, int)
     game_over: pyqtSignal = pyqtSignal(int)
+    game_started: pyqtSignal = pyqtSignal(int, int, int)
+    move_made: pyqtSignal = pyqtSignal(int, int, int)
+
+    def __init__(self, rows_and_columns: int = ROWS_AND_COLUMNS, win_length: int = WIN_LENGTH,
+                 record_path: Optional[str] = None) -> None:
+        """
+        :param rows_and_columns: number of rows and columns on playing field;
+        :param win_length: number of symbols in a row to win;
+        :param record_path: path to file where records of finished games are appended, by default games are not
+        recorded.
+        """
 
-    def __init__(self) -> None:
         super().__init__()
+        self._board_widget: Optional[BoardWidget] = None
+        self._game_id: int = 0
         self._game_in_progress: bool = False
+        self._move_search: Optional[MoveSearch] = None
+        self._record_path: Optional[str] = record_path
+        self._record_writer: Optional[GameRecordWriter] = None
         self._players: List[Player] = []
-        self._playing_field: PlayingField = PlayingField(self.ROWS_AND_COLUMNS)
+        self._playing_field: PlayingField = PlayingField(rows_and_columns, win_length)
+        self._searches: Set[MoveSearch] = set()
         self._turn: int = 0
 
+    @property
+    def computer_thinking(self) -> bool:
+        """
+        :return: True if computer player is choosing move.
+        """
+
+        return self._move_search is not None
+
     @property
     def game_in_progress(self) -> bool:
         """
@@ -28,43 +65,122 @@ class Game(QObject):
 
         return self._game_in_progress
 
-    def _end_game(self, cells: List[Cell]) -> None:
+    @property
+    def rows_and_columns(self) -> int:
+        return self._playing_field.rows_and_columns
+
+    @property
+    def win_length(self) -> int:
+        return self._playing_field.board.win_length
+
+    def _end_game(self, indexes: Optional[List[int]]) -> None:
         """
         Method ends game.
-        :param cells: list of cells that are lined up.
+        :param indexes: indexes of cells that are lined up.
         """
 
         self._game_in_progress = False
-        if cells:
-            for cell in cells:
-                cell.paint_cell()
+        if indexes:
+            self._playing_field.highlight_cells(indexes)
         self._playing_field.end_game()
 
+    @pyqtSlot(int, int)
+    def _handle_computer_move(self, game_id: int, index: int) -> None:
+        """
+        Slot makes move chosen by computer player. Moves of abandoned games are ignored.
+        :param game_id: ID of game in which move was chosen;
+        :param index: index of cell.
+        """
+
+        if self.sender() is self._move_search and game_id == self._game_id:
+            self._move_search = None
+            self.make_move(index)
+
     def _make_move_for_computer(self) -> None:
-        if isinstance(self._players[self._turn], ComputerPlayer):
-            self._players[self._turn].make_move(self._playing_field)
+        """
+        Method starts search of move in separate thread if computer player has to move.
+        """
+
+        player = self._players[self._turn]
+        if self._game_in_progress and isinstance(player, ComputerPlayer):
+            search = MoveSearch(self._game_id, player, self._playing_field.board.copy())
+            search.move_found.connect(self._handle_computer_move)
+            search.finished.connect(self._remove_search)
+            self._move_search = search
+            self._searches.add(search)
+            search.start()
+
+    @pyqtSlot()
+    def _remove_search(self) -> None:
+        self._searches.discard(self.sender())
 
-    @pyqtSlot(Cell)
-    def make_move(self, cell: Cell) -> None:
+    def _write_record(self, winner: Optional[int]) -> None:
         """
-        Slot handles move in game.
-        :param cell: cell clicked on.
+        Method appends record of finished game to file of records. If file can not be written, games are not recorded
+        any more.
+        :param winner: index of winner or None in case of draw.
         """
 
-        if not cell.symbol:
-            cell.change_symbol(self._players[self._turn].symbol)
-            to_finish, cells = self._playing_field.check()
+        if self._record_path is None:
+            return
+        board = self._playing_field.board
+        record = GameRecord(board.size, board.win_length, winner, tuple(player.TYPE for player in self._players),
+                            tuple(board.moves), int(time.time()))
+        try:
+            if self._record_writer is None:
+                self._record_writer = GameRecordWriter(self._record_path)
+            self._record_writer.write(record)
+        except (OSError, ValueError) as exc:
+            logging.warning("Failed to write record of game to '%s': %s", self._record_path, exc)
+            self._record_path = None
+
+    @pyqtSlot(int)
+    @tracing.traced("Game.make_move", "game")
+    def make_move(self, index: int) -> None:
+        """
+        Slot handles move in game, board widget sends clicks on cells to it. Move is ignored while computer is
+        thinking.
+        :param index: index of cell.
+        """
+
+        board = self._playing_field.board
+        if self._game_in_progress and self._move_search is None and 0 <= index < board.cells_number and \
+                board.is_empty(index):
+            self._playing_field.make_move(index, self._players[self._turn].symbol)
+            MOVES.inc()
+            self.move_made.emit(self._game_id, index, self._turn)
+            to_finish, indexes = self._playing_field.check()
             if to_finish:
-                self._end_game(cells)
-                self.game_over.emit(self._turn if cells else -1)
+                GAMES_FINISHED.inc()
+                self._end_game(indexes)
+                self._write_record(self._turn if indexes else None)
+                self.game_finished.emit(self._game_id, self._turn if indexes else -1)
+                self.game_over.emit(self._turn if indexes else -1)
             self._turn = (self._turn + 1) % 2
             self._make_move_for_computer()
 
-    def resize(self) -> None:
-        self._playing_field.resize()
+    def set_board_widget(self, widget: BoardWidget) -> None:
+        """
+        Method sets widget to draw playing field and handles clicks on it.
+        :param widget: board widget.
+        """
+
+        self._board_widget = widget
+        self._playing_field.set_widget(widget)
+        widget.cell_clicked.connect(self.make_move)
 
-    def set_buttons(self, buttons: List[List[QPushButton]]) -> None:
-        self._playing_field.set_buttons_to_cells(buttons, self.make_move)
+    def set_rules(self, rows_and_columns: int, win_length: int) -> None:
+        """
+        Method sets new size of playing field and number of symbols in a row to win. Game in progress is abandoned.
+        :param rows_and_columns: number of rows and columns on playing field;
+        :param win_length: number of symbols in a row to win.
+        """
+
+        self._game_in_progress = False
+        self._move_search = None
+        self._playing_field = PlayingField(rows_and_columns, win_length)
+        if self._board_widget is not None:
+            self._playing_field.set_widget(self._board_widget)
 
     def start_game(self, player_1: Player, player_2: Player) -> None:
         """
@@ -73,8 +189,22 @@ class Game(QObject):
         :param player_2: second player.
         """
 
+        GAMES_STARTED.inc()
+        self._game_id += 1
         self._game_in_progress = True
+        self._move_search = None
         self._players = [player_1, player_2]
         self._playing_field.clear()
         self._turn = 0
+        self.game_started.emit(self._game_id, self.rows_and_columns, self.win_length)
         self._make_move_for_computer()
+
+    def wait_for_computer(self) -> None:
+        """
+        Method waits until all threads in which computer chooses moves are finished. It should be called before
+        application quits.
+        """
+
+        self._move_search = None
+        for search in list(self._searches):
+            search.wait()
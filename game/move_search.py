@@ -0,0 +1,36 @@
+import logging
+from PyQt5.QtCore import pyqtSignal, QThread
+from engine.board import Board
+from game.player import ComputerPlayer, MctsComputerPlayer
+from monitoring import metrics, profiling
+
+
+COMPUTER_MOVE_TIME: metrics.Histogram = metrics.histogram("computer_move_seconds", "Time for computer to choose move")
+
+
+class MoveSearch(QThread):
+    """
+    Class for thread in which computer player chooses move. Window is redrawn and handles events while computer is
+    thinking.
+    """
+
+    move_found: pyqtSignal = pyqtSignal(int, int)
+
+    def __init__(self, game_id: int, player: ComputerPlayer, board: Board) -> None:
+        """
+        :param game_id: ID of game;
+        :param player: computer player;
+        :param board: copy of board with current position, it should not be changed while search runs.
+        """
+
+        super().__init__()
+        self._board: Board = board
+        self._game_id: int = game_id
+        self._player: ComputerPlayer = player
+
+    def run(self) -> None:
+        with COMPUTER_MOVE_TIME.time(), profiling.profile("ai"):
+            index = self._player.get_move(self._board)
+        if isinstance(self._player, MctsComputerPlayer):
+            logging.info("Computer made %.0f playouts per second", self._player.playouts_per_second)
+        self.move_found.emit(self._game_id, index)
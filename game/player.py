@@ -1,4 +1,8 @@
-from game.playing_field import PlayingField
+from typing import Optional, Union
+from engine.board import Board
+from engine.mcts import MctsEngine
+from engine.search import SearchEngine
+from engine.solved_table import load_solved_table, SolvedTable
 
 
 class Player:
@@ -6,10 +10,16 @@ class Player:
     Base class for player.
     """
 
+    TYPE: str = "human"
+
     def __init__(self, player_id: int) -> None:
         self._player_id: int = player_id
         self._symbol: str = "o" if player_id == 0 else "x"
 
+    @property
+    def player_id(self) -> int:
+        return self._player_id
+
     @property
     def symbol(self) -> str:
         return self._symbol
@@ -25,46 +35,65 @@ class Player:
 
 class ComputerPlayer(Player):
     """
-    Class for computer player.
+    Class for computer player. By default player searches moves with alpha-beta search engine, and on the hardest
+    level in classic 3x3 game it takes moves from table of solved positions.
     """
 
-    def __init__(self, player_id: int) -> None:
+    TYPE: str = "search"
+
+    def __init__(self, player_id: int, difficulty: str = "hard",
+                 engine: Optional[Union[MctsEngine, SearchEngine]] = None) -> None:
+        """
+        :param player_id: index of player;
+        :param difficulty: name of difficulty level of search engine;
+        :param engine: engine to search moves, if it is given, difficulty is ignored and table of solved positions
+        is not used.
+        """
+
         super().__init__(player_id)
+        self._engine: Union[MctsEngine, SearchEngine]
+        self._solved_table: Optional[SolvedTable] = None
+        if engine is not None:
+            self._engine = engine
+        else:
+            self._engine = SearchEngine(difficulty)
+            if difficulty == "hard":
+                self._solved_table = load_solved_table()
+
+    def get_move(self, board: Board) -> int:
+        """
+        Method chooses move for computer.
+        :param board: board with current position.
+        :return: index of cell to make move.
+        """
 
-    def make_move(self, playing_field: PlayingField) -> None:
+        if self._solved_table is not None and self._solved_table.is_applicable(board):
+            move = self._solved_table.get_move(board)
+            if move is not None:
+                return move
+        return self._engine.find_move(board)
+
+
+class MctsComputerPlayer(ComputerPlayer):
+    """
+    Class for computer player that searches moves with Monte-Carlo tree search. It is intended for large fields where
+    alpha-beta search can not reach useful depth.
+    """
+
+    TYPE: str = "mcts"
+
+    def __init__(self, player_id: int, time_limit: float = MctsEngine.TIME_LIMIT) -> None:
+        """
+        :param player_id: index of player;
+        :param time_limit: max time in seconds to search move.
+        """
+
+        super().__init__(player_id, engine=MctsEngine(time_limit))
+
+    @property
+    def playouts_per_second(self) -> float:
         """
-        Method makes move for computer.
-        :param playing_field: playing field.
+        :return: speed of playouts in the last search.
         """
 
-        any_empty_cell = None
-        for row in range(playing_field.rows_and_columns):
-            column_sum = 0
-            empty_cell = None
-            for column in range(playing_field.rows_and_columns):
-                cell = playing_field.cells[row][column]
-                column_sum += cell.value
-                if cell.value == 0:
-                    empty_cell = cell
-                    if any_empty_cell is None:
-                        any_empty_cell = cell
-            if column_sum == 2 * self.value and empty_cell:
-                empty_cell.button.click()
-                return
-
-        for column in range(playing_field.rows_and_columns):
-            row_sum = 0
-            empty_cell = None
-            for row in range(playing_field.rows_and_columns):
-                cell = playing_field.cells[row][column]
-                row_sum += cell.value
-                if cell.value == 0:
-                    empty_cell = cell
-                    if any_empty_cell is None:
-                        any_empty_cell = cell
-            if row_sum == 2 * self.value and empty_cell:
-                empty_cell.button.click()
-                return
-
-        if any_empty_cell:
-            any_empty_cell.button.click()
+        return self._engine.last_playouts_per_second
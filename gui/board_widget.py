@@ -0,0 +1,162 @@
+from typing import Dict, List, Optional, Set, Tuple
+from PyQt5.QtCore import pyqtSignal, QPoint, QRect, Qt
+from PyQt5.QtGui import QColor, QMouseEvent, QPainter, QPaintEvent, QPalette, QResizeEvent
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+from gui.symbols import clear_scaled_symbols, get_scaled_symbol_pixmap
+
+
+class BoardWidget(QWidget):
+    """
+    Class for widget of playing field. Widget draws all cells itself, so playing field of any size is one widget.
+    Clicked cell is found from coordinates of click, after move only changed cells are repainted.
+    """
+
+    CELL_SPACING: int = 2
+    HIGHLIGHT_COLORS: Dict[str, QColor] = {"o": QColor("#2481BA"), "x": QColor("#1CB34B")}
+    SYMBOL_SCALE: float = 0.75
+    cell_clicked: pyqtSignal = pyqtSignal(int)
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        :param parent: parent widget.
+        """
+
+        super().__init__(parent)
+        self._highlighted_cells: Set[int] = set()
+        self._pressed_index: Optional[int] = None
+        self._rows_and_columns: int = 0
+        self._symbols: List[str] = []
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(1, 1)
+
+    @property
+    def rows_and_columns(self) -> int:
+        return self._rows_and_columns
+
+    def _get_cell_rect(self, index: int) -> QRect:
+        """
+        Method returns rectangle of cell on widget. Borders of cells are rounded to pixels, so cells cover the whole
+        widget.
+        :param index: index of cell.
+        :return: rectangle.
+        """
+
+        row, column = divmod(index, self._rows_and_columns)
+        left = column * self.width() // self._rows_and_columns
+        top = row * self.height() // self._rows_and_columns
+        right = (column + 1) * self.width() // self._rows_and_columns
+        bottom = (row + 1) * self.height() // self._rows_and_columns
+        return QRect(left, top, right - left, bottom - top)
+
+    def _get_cell_range(self, rect: QRect) -> Tuple[range, range]:
+        """
+        Method returns rows and columns of cells that intersect rectangle.
+        :param rect: rectangle on widget.
+        :return: range of rows and range of columns.
+        """
+
+        number = self._rows_and_columns
+        rows = range(max(rect.top() * number // self.height() - 1, 0),
+                     min((rect.bottom() + 1) * number // self.height() + 1, number))
+        columns = range(max(rect.left() * number // self.width() - 1, 0),
+                        min((rect.right() + 1) * number // self.width() + 1, number))
+        return rows, columns
+
+    def _get_index_at(self, point: QPoint) -> Optional[int]:
+        """
+        Method returns index of cell under point.
+        :param point: point on widget.
+        :return: index of cell or None if there is no cell under point.
+        """
+
+        if not self._rows_and_columns or not self.rect().contains(point):
+            return None
+        row = min(point.y() * self._rows_and_columns // self.height(), self._rows_and_columns - 1)
+        column = min(point.x() * self._rows_and_columns // self.width(), self._rows_and_columns - 1)
+        return row * self._rows_and_columns + column
+
+    def _update_cell(self, index: int) -> None:
+        self.update(self._get_cell_rect(index))
+
+    def clear(self) -> None:
+        """
+        Method removes symbols and highlighting from all cells.
+        """
+
+        self._highlighted_cells = set()
+        self._symbols = [""] * (self._rows_and_columns ** 2)
+        self.update()
+
+    def highlight_cells(self, indexes: List[int]) -> None:
+        """
+        Method paints cells in color of their symbols.
+        :param indexes: indexes of cells.
+        """
+
+        for index in indexes:
+            self._highlighted_cells.add(index)
+            self._update_cell(index)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.LeftButton:
+            self._pressed_index = self._get_index_at(event.pos())
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.LeftButton:
+            index = self._get_index_at(event.pos())
+            pressed_index, self._pressed_index = self._pressed_index, None
+            if index is not None and index == pressed_index:
+                self.cell_clicked.emit(index)
+        super().mouseReleaseEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Method draws cells that intersect area to be repainted.
+        :param event: paint event.
+        """
+
+        if not self._rows_and_columns:
+            return
+        painter = QPainter(self)
+        palette = self.palette()
+        empty_color = palette.color(QPalette.Button if self.isEnabled() else QPalette.Midlight)
+        symbol_width = int(self.SYMBOL_SCALE * self.width() / self._rows_and_columns)
+        symbol_height = int(self.SYMBOL_SCALE * self.height() / self._rows_and_columns)
+        painter.fillRect(event.rect(), palette.color(QPalette.Mid))
+        rows, columns = self._get_cell_range(event.rect())
+        for row in rows:
+            for column in columns:
+                index = row * self._rows_and_columns + column
+                rect = self._get_cell_rect(index).adjusted(0, 0, -self.CELL_SPACING, -self.CELL_SPACING)
+                symbol = self._symbols[index]
+                color = self.HIGHLIGHT_COLORS[symbol] if index in self._highlighted_cells else empty_color
+                painter.fillRect(rect, color)
+                if symbol:
+                    pixmap = get_scaled_symbol_pixmap(symbol, symbol_width, symbol_height)
+                    painter.drawPixmap(rect.x() + (rect.width() - pixmap.width()) // 2,
+                                       rect.y() + (rect.height() - pixmap.height()) // 2, pixmap)
+        painter.end()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        clear_scaled_symbols()
+        super().resizeEvent(event)
+
+    def set_rows_and_columns(self, rows_and_columns: int) -> None:
+        """
+        Method sets number of rows and columns and clears cells.
+        :param rows_and_columns: number of rows and columns.
+        """
+
+        self._rows_and_columns = rows_and_columns
+        self.clear()
+
+    def set_symbol(self, index: int, symbol: str) -> None:
+        """
+        Method puts symbol in cell.
+        :param index: index of cell;
+        :param symbol: symbol.
+        """
+
+        self._symbols[index] = symbol
+        self._update_cell(index)
@@ -1,62 +1,58 @@
 import os
-from typing import List, Optional, Tuple
-import numpy as np
-from PyQt5.QtCore import pyqtSignal, pyqtSlot
+from typing import Dict, Optional
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, QRegExp, QSortFilterProxyModel, Qt, QTimer
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWidgets import QAbstractItemView, QDialog, QHeaderView, QLabel
-from PyQt5.uic import loadUi
+from PyQt5.QtWidgets import QAbstractItemView, QDialog, QHeaderView
 from gui import utils as ut
+from gui.peer_table_model import PeerTableModel
+from gui.ui_connection_window import Ui_Dialog
 
 
-class ConnectionWindow(QDialog):
+class ConnectionWindow(QDialog, Ui_Dialog):
     """
-    Class for selecting an adversary over a local network.
+    Class for selecting an adversary over a local network. Found and lost players are collected for a short time and
+    then applied to table model at once.
     """
 
-    COLUMN_COUNT: int = 2
+    UPDATE_INTERVAL: int = 100
     login_set: pyqtSignal = pyqtSignal(str)
     opponent_selected: pyqtSignal = pyqtSignal(str)
 
     def __init__(self, player_login: Optional[str] = None) -> None:
         super().__init__()
-        self._new_players: List[Tuple[str, str]] = []
-        self._old_players: List[Tuple[str, str]] = []
         self._login: str = player_login
+        self._model: PeerTableModel = PeerTableModel(self)
+        self._pending_players: Dict[str, Optional[str]] = {}
+        self._proxy_model: QSortFilterProxyModel = QSortFilterProxyModel(self)
+        self._update_timer: QTimer = QTimer(self)
         self._init_ui()
 
-    def _add_player_to_table(self, address: str, login: str) -> None:
-        """
-        Method adds new player to table.
-        :param address: IP address of new player;
-        :param login: new player login.
-        """
-
-        rows = self.table_widget.rowCount()
-        for row in range(rows):
-            if address == self.table_widget.cellWidget(row, 0).text():
-                self.table_widget.cellWidget(row, 1).setText(login)
-                return
-        self.table_widget.setRowCount(rows + 1)
-        self.table_widget.setCellWidget(rows, 0, QLabel(address))
-        self.table_widget.setCellWidget(rows, 1, QLabel(login))
-
     def _init_table(self) -> None:
         """
-        Method initializes table widget.
+        Method initializes table view.
         """
 
-        self.table_widget.setColumnCount(self.COLUMN_COUNT)
-        self.table_widget.setHorizontalHeaderLabels(["IP адрес", "Логин"])
-        self.table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table_widget.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.table_widget.cellDoubleClicked.connect(self.select_opponent)
+        self._proxy_model.setSourceModel(self._model)
+        self._proxy_model.setSortRole(PeerTableModel.SORT_ROLE)
+        self._proxy_model.setFilterKeyColumn(-1)
+        self._proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.table_view.setModel(self._proxy_model)
+        self.table_view.setSortingEnabled(True)
+        self.table_view.sortByColumn(PeerTableModel.ADDRESS_COLUMN, Qt.AscendingOrder)
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_view.verticalHeader().hide()
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table_view.doubleClicked.connect(self.select_opponent)
+        self.line_edit_filter.textChanged.connect(self.set_filter)
 
     def _init_ui(self) -> None:
         """
         Method initializes widgets on dialog window.
         """
 
-        loadUi(os.path.join(ut.DIR_MEDIA, "connection_window.ui"), self)
+        self.setupUi(self)
         self.setWindowTitle("Найти соперника")
         self.setWindowIcon(QIcon(os.path.join(ut.DIR_MEDIA, "icon.png")))
 
@@ -66,39 +62,40 @@ class ConnectionWindow(QDialog):
         self.button_set_login.clicked.connect(self.set_player_login)
         self.button_select_player.clicked.connect(self.select_opponent)
         self.button_cancel.clicked.connect(self.close)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_INTERVAL)
+        self._update_timer.timeout.connect(self.update_table)
         self._init_table()
 
-    def _remove_player(self, address: str) -> None:
+    def _schedule_update(self, address: str, login: Optional[str]) -> None:
         """
-        Method removes player with given IP address from table widget.
-        :param address: IP address of player.
+        Method saves change of player to apply it to table later.
+        :param address: IP address of player;
+        :param login: login of player or None if player was lost.
         """
 
-        for row in range(self.table_widget.rowCount()):
-            if self.table_widget.cellWidget(row, 0).text() == address:
-                self.table_widget.removeRow(row)
-                break
+        self._pending_players[address] = login
+        if not self._update_timer.isActive():
+            self._update_timer.start()
 
     @pyqtSlot(str, str)
     def add_player(self, address: str, login: str) -> None:
         """
-        Slot adds new player.
+        Slot adds new player or updates login of player.
         :param address: IP address of player;
         :param login: player login.
         """
 
-        self._new_players.append((address, login))
-        if (address, login) not in self._old_players:
-            self._add_player_to_table(address, login)
+        self._schedule_update(address, login)
 
-    @pyqtSlot()
-    def complete_revealing(self) -> None:
-        new_addresses = np.array([item[0] for item in self._new_players])
-        old_addresses = np.array([item[0] for item in self._old_players])
-        removed_addresses = np.setdiff1d(old_addresses, new_addresses)
-        for address in removed_addresses:
-            self._remove_player(address)
-        self._old_players = self._new_players
+    @pyqtSlot(str)
+    def remove_player(self, address: str) -> None:
+        """
+        Slot removes player with given IP address from table.
+        :param address: IP address of player.
+        """
+
+        self._schedule_update(address, None)
 
     @pyqtSlot()
     def select_opponent(self) -> None:
@@ -106,12 +103,20 @@ class ConnectionWindow(QDialog):
         Slot selects opponent.
         """
 
-        row = self.table_widget.currentRow()
-        widget = self.table_widget.cellWidget(row, 0)
-        if widget:
-            self.opponent_selected.emit(widget.text())
+        index = self._proxy_model.mapToSource(self.table_view.currentIndex())
+        if index.isValid():
+            self.opponent_selected.emit(self._model.get_address(index.row()))
             self.close()
 
+    @pyqtSlot(str)
+    def set_filter(self, text: str) -> None:
+        """
+        Slot shows only players which IP address or login contains text.
+        :param text: text to search.
+        """
+
+        self._proxy_model.setFilterRegExp(QRegExp(text, Qt.CaseInsensitive, QRegExp.FixedString))
+
     @pyqtSlot()
     def set_player_login(self) -> None:
         """
@@ -121,5 +126,11 @@ class ConnectionWindow(QDialog):
         self.login_set.emit(self.line_edit_login.text())
 
     @pyqtSlot()
-    def start_revealing(self) -> None:
-        self._new_players = []
+    def update_table(self) -> None:
+        """
+        Slot applies collected changes of players to table.
+        """
+
+        pending_players, self._pending_players = self._pending_players, {}
+        self._model.remove_peers(address for address, login in pending_players.items() if login is None)
+        self._model.add_peers((address, login) for address, login in pending_players.items() if login is not None)
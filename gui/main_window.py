@@ -1,55 +1,66 @@
 import os
 import random
-import socket
 import uuid
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 from PyQt5.QtCore import pyqtSignal, pyqtSlot
-from PyQt5.QtGui import QCloseEvent, QIcon, QResizeEvent
+from PyQt5.QtGui import QCloseEvent, QIcon
 from PyQt5.QtWidgets import QMainWindow, QMessageBox
-from PyQt5.uic import loadUi
-from connection import Client, Server
-from game import ComputerPlayer, Game, Player
+from engine import records
+from game import ComputerPlayer, Game, MctsComputerPlayer, Player
 from gui import utils as ut
-from gui.connection_window import ConnectionWindow
-from revealer import RevealerClient, RevealerServer
+from gui.ui_main_window import Ui_MainWindow
+if TYPE_CHECKING:
+    from connection import Client, Server
+    from gui.connection_window import ConnectionWindow
+    from revealer import RevealerClient, RevealerServer
 
 
-class MainWindow(QMainWindow):
+class MainWindow(QMainWindow, Ui_MainWindow):
     """
-    Class for main window of application.
+    Class for main window of application. Window for search of opponent and threads for network play are created
+    only when user starts online game for the first time, so application starts faster.
     """
 
-    choice_made: pyqtSignal = pyqtSignal(socket.socket, str)
+    DIFFICULTIES: Dict[str, str] = {"Легко": "easy",
+                                    "Средне": "medium",
+                                    "Сложно": "hard",
+                                    "Монте-Карло": "mcts"}
+    RULES: Dict[str, Tuple[int, int]] = {"3×3": (3, 3),
+                                         "15×15, 5 в ряд": (15, 5),
+                                         "19×19, 5 в ряд": (19, 5)}
+    choice_made: pyqtSignal = pyqtSignal(int, str)
 
     def __init__(self) -> None:
         super().__init__()
-        self._game: Game = Game()
+        self._game: Game = Game(record_path=records.DEFAULT_PATH)
         self._game.game_over.connect(self.end_game)
         self._id: str = uuid.uuid4()
         self._login: str = None
-        self._connection_window: ConnectionWindow = ConnectionWindow(self._login)
-        self._revealer_client: RevealerClient = RevealerClient()
-        self._revealer_server: RevealerServer = RevealerServer()
-        self._client: Client = Client()
-        self._server: Server = Server()
+        self._client: Optional["Client"] = None
+        self._connection_window: Optional["ConnectionWindow"] = None
+        self._revealer_client: Optional["RevealerClient"] = None
+        self._revealer_server: Optional["RevealerServer"] = None
+        self._server: Optional["Server"] = None
         self._init_ui()
-        self._connect_signals()
-        self._revealer_client.start()
-        self._revealer_server.start()
-        self._client.start()
-        self._server.start()
 
     def _connect_signals(self) -> None:
         """
-        Method connects signals.
+        Method connects signals of network objects.
         """
 
         self._client.setTerminationEnabled(True)
+        self._client.connection_failed.connect(self.handle_connection_failure)
+        self._client.disconnected.connect(self.handle_disconnection)
+        self._client.message_received.connect(self.handle_message_from_server)
+        self._game.game_finished.connect(self._server.finish_broadcast)
+        self._game.game_started.connect(self._server.start_broadcast)
+        self._game.move_made.connect(self._server.broadcast_move)
         self._server.setTerminationEnabled(True)
         self._server.challenged.connect(self.handle_call_to_online_game)
+        self.choice_made.connect(self._server.answer_challenge)
         self._revealer_client.setTerminationEnabled(True)
         self._revealer_client.player_found.connect(self._connection_window.add_player)
-        self._revealer_client.search_completed.connect(self._connection_window.complete_revealing)
-        self._revealer_client.search_started.connect(self._connection_window.start_revealing)
+        self._revealer_client.player_lost.connect(self._connection_window.remove_player)
         self._revealer_server.setTerminationEnabled(True)
         self._connection_window.login_set.connect(self.set_login)
         self._connection_window.opponent_selected.connect(self._client.start_game)
@@ -59,7 +70,7 @@ class MainWindow(QMainWindow):
         Method initializes widgets on main window.
         """
 
-        loadUi(os.path.join(ut.DIR_MEDIA, "main_window.ui"), self)
+        self.setupUi(self)
         self.setWindowTitle("Крестики-нолики")
         self.setWindowIcon(QIcon(os.path.join(ut.DIR_MEDIA, "icon.png")))
 
@@ -67,15 +78,33 @@ class MainWindow(QMainWindow):
         self.button_start_game_with_computer.clicked.connect(self.start_game_with_computer)
         self.button_start_online_game.clicked.connect(self.start_online_game)
 
-        cell_buttons = []
-        for row in range(Game.ROWS_AND_COLUMNS):
-            column_buttons = []
-            for column in range(Game.ROWS_AND_COLUMNS):
-                button = getattr(self, f"button_{row}_{column}")
-                column_buttons.append(button)
-                button.setEnabled(False)
-            cell_buttons.append(column_buttons)
-        self._game.set_buttons(cell_buttons)
+        for rules_name in self.RULES:
+            self.combo_box_rules.addItem(rules_name)
+        self.combo_box_rules.currentTextChanged.connect(self.set_rules)
+        for difficulty_name in self.DIFFICULTIES:
+            self.combo_box_difficulty.addItem(difficulty_name)
+        self.combo_box_difficulty.setCurrentText("Сложно")
+        self._game.set_board_widget(self.board_widget)
+
+    def _start_networking(self) -> None:
+        """
+        Method creates window for search of opponent and starts threads for network play.
+        """
+
+        from connection import Client, Server
+        from gui.connection_window import ConnectionWindow
+        from revealer import RevealerClient, RevealerServer
+
+        self._connection_window = ConnectionWindow(self._login)
+        self._revealer_client = RevealerClient()
+        self._revealer_server = RevealerServer()
+        self._client = Client()
+        self._server = Server()
+        self._connect_signals()
+        self._revealer_client.start()
+        self._revealer_server.start()
+        self._client.start()
+        self._server.start()
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """
@@ -83,10 +112,12 @@ class MainWindow(QMainWindow):
         :param event: close event.
         """
 
-        self._revealer_client.quit()
-        self._revealer_server.close_server()
-        self._client.quit()
-        self._server.close_server()
+        if self._connection_window is not None:
+            self._revealer_client.stop()
+            self._revealer_server.close_server()
+            self._client.close_client()
+            self._server.close_server()
+        self._game.wait_for_computer()
         super().closeEvent(event)
 
     @pyqtSlot(int)
@@ -102,30 +133,51 @@ class MainWindow(QMainWindow):
             message = f"Игрок #{player_index + 1} выиграл"
         ut.show_message("Информация", message)
 
-    @pyqtSlot(socket.socket)
-    def handle_call_to_online_game(self, sock: socket.socket) -> None:
+    @pyqtSlot(int, str)
+    def handle_call_to_online_game(self, session_id: int, address: str) -> None:
         """
         Slot handles call to start online game.
-        :param sock: socket of the opponent who called to play online.
+        :param session_id: ID of session of the opponent who called to play online;
+        :param address: IP address of the opponent.
         """
 
         if self._game.game_in_progress:
             return
-        if QMessageBox.AcceptRole == ut.show_message("Информация", f"Игрок {sock.getsockname()} бросил Вам вызов. "
+        if QMessageBox.AcceptRole == ut.show_message("Информация", f"Игрок {address} бросил Вам вызов. "
                                                                    f"Хотите сыграть?", button_ok=True):
             choice = "Yes"
         else:
             choice = "No"
-        self.choice_made.emit(sock, choice)
+        self.choice_made.emit(session_id, choice)
 
-    def resizeEvent(self, event: QResizeEvent) -> None:
+    @pyqtSlot(str)
+    def handle_connection_failure(self, address: str) -> None:
         """
-        Method handles resize of main window.
-        :param event: resize event.
+        Slot reports that connection to server of opponent failed.
+        :param address: IP address of the opponent.
         """
 
-        self._game.resize()
-        super().resizeEvent(event)
+        ut.show_message("Ошибка", f"Не удалось подключиться к игроку {address}")
+
+    @pyqtSlot(str)
+    def handle_disconnection(self, address: str) -> None:
+        """
+        Slot reports that server of opponent closed connection.
+        :param address: IP address of the opponent.
+        """
+
+        ut.show_message("Информация", f"Игрок {address} разорвал соединение")
+
+    @pyqtSlot(dict)
+    def handle_message_from_server(self, message: Dict[str, Any]) -> None:
+        """
+        Slot handles message from server of opponent.
+        :param message: message.
+        """
+
+        if message.get("MESSAGE") == "Start game" and "ANSWER" in message:
+            answer = "принял" if message["ANSWER"] == "Yes" else "отклонил"
+            ut.show_message("Информация", f"Соперник {answer} Ваш вызов")
 
     @pyqtSlot(str)
     def set_login(self, new_login: str) -> None:
@@ -137,14 +189,28 @@ class MainWindow(QMainWindow):
         self._login = new_login
         self._revealer_server.set_login(self._login)
 
+    @pyqtSlot(str)
+    def set_rules(self, rules_name: str) -> None:
+        """
+        Slot sets size of playing field and number of symbols in a row to win.
+        :param rules_name: name of rules.
+        """
+
+        self._game.set_rules(*self.RULES[rules_name])
+
     @pyqtSlot()
     def start_game_with_computer(self) -> None:
         """
         Slot starts game with computer.
         """
 
-        id_for_player = random.randint(0, 1)
-        players = (Player(0), ComputerPlayer(1)) if id_for_player == 0 else (ComputerPlayer(0), Player(1))
+        difficulty = self.DIFFICULTIES[self.combo_box_difficulty.currentText()]
+        id_for_computer = 1 - random.randint(0, 1)
+        if difficulty == "mcts":
+            computer_player = MctsComputerPlayer(id_for_computer)
+        else:
+            computer_player = ComputerPlayer(id_for_computer, difficulty)
+        players = (Player(0), computer_player) if id_for_computer == 1 else (computer_player, Player(1))
         self._game.start_game(*players)
 
     @pyqtSlot()
@@ -163,4 +229,6 @@ class MainWindow(QMainWindow):
         Slot starts online game.
         """
 
+        if self._connection_window is None:
+            self._start_networking()
         self._connection_window.show()
@@ -0,0 +1,108 @@
+import ipaddress
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+
+class PeerTableModel(QAbstractTableModel):
+    """
+    Class for table model of players found in local network. Row of player is found by IP address in dictionary, so
+    adding, updating and removing player does not scan table. New players are appended to the end of table, order of
+    rows is set by proxy model that sorts them.
+    """
+
+    ADDRESS_COLUMN: int = 0
+    HEADERS: Tuple[str, ...] = ("IP адрес", "Логин")
+    LOGIN_COLUMN: int = 1
+    SORT_ROLE: int = Qt.UserRole
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._peers: List[List[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._sort_keys: Dict[str, int] = {}
+
+    @staticmethod
+    def _get_sort_key(address: str) -> int:
+        try:
+            return int(ipaddress.ip_address(address))
+        except ValueError:
+            return 0
+
+    def add_peers(self, peers: Iterable[Tuple[str, str]]) -> None:
+        """
+        Method adds new players to table and updates logins of players that are already in table. All new players
+        are inserted at once.
+        :param peers: IP addresses and logins of players.
+        """
+
+        new_peers = {}
+        for address, login in peers:
+            row = self._rows.get(address)
+            if row is None:
+                new_peers[address] = login
+            elif self._peers[row][self.LOGIN_COLUMN] != login:
+                self._peers[row][self.LOGIN_COLUMN] = login
+                index = self.index(row, self.LOGIN_COLUMN)
+                self.dataChanged.emit(index, index)
+        if not new_peers:
+            return
+        first_row = len(self._peers)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(new_peers) - 1)
+        for row, (address, login) in enumerate(new_peers.items(), first_row):
+            self._peers.append([address, login])
+            self._rows[address] = row
+            self._sort_keys[address] = self._get_sort_key(address)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._peers = []
+        self._rows = {}
+        self._sort_keys = {}
+        self.endResetModel()
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        value = self._peers[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return value
+        if role == self.SORT_ROLE:
+            return self._sort_keys[value] if index.column() == self.ADDRESS_COLUMN else value.lower()
+        return None
+
+    def get_address(self, row: int) -> str:
+        return self._peers[row][self.ADDRESS_COLUMN]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def remove_peers(self, addresses: Iterable[str]) -> None:
+        """
+        Method removes players from table. Adjacent rows are removed at once, rows are indexed again once after all
+        rows are removed.
+        :param addresses: IP addresses of players.
+        """
+
+        rows = sorted({self._rows.pop(address) for address in addresses if address in self._rows}, reverse=True)
+        if not rows:
+            return
+        last_row = rows[0]
+        for row, next_row in zip(rows, rows[1:] + [None]):
+            if next_row != row - 1:
+                self.beginRemoveRows(QModelIndex(), row, last_row)
+                for address, _ in self._peers[row:last_row + 1]:
+                    del self._sort_keys[address]
+                del self._peers[row:last_row + 1]
+                self.endRemoveRows()
+                last_row = next_row
+        for row in range(rows[-1], len(self._peers)):
+            self._rows[self._peers[row][self.ADDRESS_COLUMN]] = row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._peers)
@@ -0,0 +1,42 @@
+import os
+from functools import lru_cache
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap
+from gui.utils import DIR_MEDIA
+
+
+SCALED_CACHE_SIZE: int = 16
+
+
+def clear_scaled_symbols() -> None:
+    """
+    Function clears cache of scaled images of symbols. It should be called when size of cells changes.
+    """
+
+    get_scaled_symbol_pixmap.cache_clear()
+
+
+@lru_cache(maxsize=SCALED_CACHE_SIZE)
+def get_scaled_symbol_pixmap(symbol: str, width: int, height: int) -> QPixmap:
+    """
+    Function returns image of symbol scaled to given size keeping aspect ratio. Image is scaled once for every size
+    and drawn in all cells.
+    :param symbol: symbol;
+    :param width: max width of image;
+    :param height: max height of image.
+    :return: image.
+    """
+
+    return get_symbol_pixmap(symbol).scaled(max(width, 1), max(height, 1), Qt.KeepAspectRatio,
+                                            Qt.SmoothTransformation)
+
+
+@lru_cache(maxsize=None)
+def get_symbol_pixmap(symbol: str) -> QPixmap:
+    """
+    Function returns image of symbol, image is read from file only once.
+    :param symbol: symbol.
+    :return: image.
+    """
+
+    return QPixmap(os.path.join(DIR_MEDIA, f"{symbol}.png"))
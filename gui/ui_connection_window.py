@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'media/connection_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(454, 248)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.group_box_login = QtWidgets.QGroupBox(Dialog)
+        self.group_box_login.setObjectName("group_box_login")
+        self.horizontal_layout = QtWidgets.QHBoxLayout(self.group_box_login)
+        self.horizontal_layout.setObjectName("horizontal_layout")
+        self.label_login = QtWidgets.QLabel(self.group_box_login)
+        self.label_login.setObjectName("label_login")
+        self.horizontal_layout.addWidget(self.label_login)
+        self.line_edit_login = QtWidgets.QLineEdit(self.group_box_login)
+        self.line_edit_login.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.line_edit_login.setObjectName("line_edit_login")
+        self.horizontal_layout.addWidget(self.line_edit_login)
+        self.button_set_login = QtWidgets.QPushButton(self.group_box_login)
+        self.button_set_login.setObjectName("button_set_login")
+        self.horizontal_layout.addWidget(self.button_set_login)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontal_layout.addItem(spacerItem)
+        self.verticalLayout.addWidget(self.group_box_login)
+        self.group_box_players = QtWidgets.QGroupBox(Dialog)
+        self.group_box_players.setObjectName("group_box_players")
+        self.vertical_layout = QtWidgets.QVBoxLayout(self.group_box_players)
+        self.vertical_layout.setObjectName("vertical_layout")
+        self.line_edit_filter = QtWidgets.QLineEdit(self.group_box_players)
+        self.line_edit_filter.setClearButtonEnabled(True)
+        self.line_edit_filter.setObjectName("line_edit_filter")
+        self.vertical_layout.addWidget(self.line_edit_filter)
+        self.table_view = QtWidgets.QTableView(self.group_box_players)
+        self.table_view.setObjectName("table_view")
+        self.vertical_layout.addWidget(self.table_view)
+        self.horizontal_layout_2 = QtWidgets.QHBoxLayout()
+        self.horizontal_layout_2.setObjectName("horizontal_layout_2")
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontal_layout_2.addItem(spacerItem1)
+        self.button_select_player = QtWidgets.QPushButton(self.group_box_players)
+        self.button_select_player.setObjectName("button_select_player")
+        self.horizontal_layout_2.addWidget(self.button_select_player)
+        self.button_cancel = QtWidgets.QPushButton(self.group_box_players)
+        self.button_cancel.setObjectName("button_cancel")
+        self.horizontal_layout_2.addWidget(self.button_cancel)
+        self.vertical_layout.addLayout(self.horizontal_layout_2)
+        self.verticalLayout.addWidget(self.group_box_players)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.group_box_login.setTitle(_translate("Dialog", "Введите свой логин"))
+        self.label_login.setText(_translate("Dialog", "Логин"))
+        self.button_set_login.setText(_translate("Dialog", "Задать логин"))
+        self.group_box_players.setTitle(_translate("Dialog", "Выберите противника"))
+        self.line_edit_filter.setPlaceholderText(_translate("Dialog", "Поиск по IP адресу или логину"))
+        self.button_select_player.setText(_translate("Dialog", "Выбрать"))
+        self.button_cancel.setText(_translate("Dialog", "Отмена"))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'media/main_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(468, 444)
+        self.central_widget = QtWidgets.QWidget(MainWindow)
+        self.central_widget.setObjectName("central_widget")
+        self.vertical_layout = QtWidgets.QVBoxLayout(self.central_widget)
+        self.vertical_layout.setContentsMargins(8, 8, 8, 8)
+        self.vertical_layout.setSpacing(5)
+        self.vertical_layout.setObjectName("vertical_layout")
+        self.horizontal_layout = QtWidgets.QHBoxLayout()
+        self.horizontal_layout.setObjectName("horizontal_layout")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontal_layout.addItem(spacerItem)
+        self.button_start_offline_game = QtWidgets.QPushButton(self.central_widget)
+        self.button_start_offline_game.setObjectName("button_start_offline_game")
+        self.horizontal_layout.addWidget(self.button_start_offline_game)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontal_layout.addItem(spacerItem1)
+        self.button_start_game_with_computer = QtWidgets.QPushButton(self.central_widget)
+        self.button_start_game_with_computer.setObjectName("button_start_game_with_computer")
+        self.horizontal_layout.addWidget(self.button_start_game_with_computer)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontal_layout.addItem(spacerItem2)
+        self.button_start_online_game = QtWidgets.QPushButton(self.central_widget)
+        self.button_start_online_game.setObjectName("button_start_online_game")
+        self.horizontal_layout.addWidget(self.button_start_online_game)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontal_layout.addItem(spacerItem3)
+        self.combo_box_rules = QtWidgets.QComboBox(self.central_widget)
+        self.combo_box_rules.setObjectName("combo_box_rules")
+        self.horizontal_layout.addWidget(self.combo_box_rules)
+        self.combo_box_difficulty = QtWidgets.QComboBox(self.central_widget)
+        self.combo_box_difficulty.setObjectName("combo_box_difficulty")
+        self.horizontal_layout.addWidget(self.combo_box_difficulty)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontal_layout.addItem(spacerItem4)
+        self.vertical_layout.addLayout(self.horizontal_layout)
+        self.board_widget = BoardWidget(self.central_widget)
+        self.board_widget.setObjectName("board_widget")
+        self.vertical_layout.addWidget(self.board_widget)
+        self.vertical_layout.setStretch(1, 1)
+        MainWindow.setCentralWidget(self.central_widget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 468, 21))
+        self.menubar.setObjectName("menubar")
+        MainWindow.setMenuBar(self.menubar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.button_start_offline_game.setText(_translate("MainWindow", "Играть"))
+        self.button_start_game_with_computer.setText(_translate("MainWindow", "Играть с компьютером"))
+        self.button_start_online_game.setText(_translate("MainWindow", "Играть по сети"))
+from gui.board_widget import BoardWidget
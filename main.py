@@ -1,12 +1,87 @@
+import argparse
+import logging
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from gui.logger import logger
-from gui.main_window import MainWindow
+import time
+from typing import List, Tuple
 
 
-if __name__ == "__main__":
+METRICS_DUMP_INTERVAL: int = 10000
+
+
+def dump_metrics(path: str) -> None:
+    """
+    Function writes metrics to file. Error is logged, so application keeps working if file can not be written.
+    :param path: path to file.
+    """
+
+    from monitoring.exposition import dump_metrics as dump
+
+    try:
+        dump(path)
+    except OSError as exc:
+        logging.error("Failed to write metrics to %s: %s", path, exc)
+
+
+def parse_arguments() -> Tuple[argparse.Namespace, List[str]]:
+    """
+    Function parses options of application, options can also be set with environment variables. Unknown options are
+    left for Qt.
+    :return: options of application and arguments for Qt.
+    """
+
+    from monitoring import profiling
+
+    parser = argparse.ArgumentParser(description="Tic-tac-toe")
+    parser.add_argument("--metrics-port", type=int, default=os.environ.get("TIC_TAC_TOE_METRICS_PORT"),
+                        help="local port of HTTP server with metrics in text format of Prometheus "
+                             "(TIC_TAC_TOE_METRICS_PORT)")
+    parser.add_argument("--metrics-file", default=os.environ.get("TIC_TAC_TOE_METRICS_FILE"),
+                        help="file to write metrics to every 10 seconds and on exit (TIC_TAC_TOE_METRICS_FILE)")
+    profiling.add_arguments(parser)
+    args, qt_args = parser.parse_known_args()
+    try:
+        profiling.setup(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+    return args, sys.argv[:1] + qt_args
+
+
+def main() -> None:
+    """
+    Function runs application and logs time from start of application to the moment when main window is shown.
+    Modules are imported here to include time of their import.
+    """
+
+    start_time = time.perf_counter()
+    args, qt_args = parse_arguments()
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+    from gui.logger import logger
+    from gui.main_window import MainWindow
+    from monitoring import profiling
+
     logger
-    app = QApplication(sys.argv)
+    if args.metrics_port is not None:
+        from monitoring.exposition import start_metrics_server
+
+        try:
+            start_metrics_server(args.metrics_port)
+        except OSError as exc:
+            logging.error("Failed to start server of metrics on port %d: %s", args.metrics_port, exc)
+    app = QApplication(qt_args)
     main_window = MainWindow()
     main_window.show()
+    QTimer.singleShot(0, lambda: logging.info("Main window was shown in %.3f s", time.perf_counter() - start_time))
+    if args.metrics_file:
+        metrics_timer = QTimer()
+        metrics_timer.timeout.connect(lambda: dump_metrics(args.metrics_file))
+        metrics_timer.start(METRICS_DUMP_INTERVAL)
     app.exec_()
+    if args.metrics_file:
+        dump_metrics(args.metrics_file)
+    profiling.save()
+
+
+if __name__ == "__main__":
+    main()
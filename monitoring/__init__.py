@@ -0,0 +1,4 @@
+from monitoring.metrics import Counter, Gauge, Histogram, MetricsRegistry, REGISTRY
+
+
+__all__ = ["Counter", "Gauge", "Histogram", "MetricsRegistry", "REGISTRY"]
@@ -0,0 +1,69 @@
+import logging
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from monitoring.metrics import MetricsRegistry, REGISTRY
+
+
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+HOST: str = "127.0.0.1"
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """
+    Class for handler of HTTP requests to metrics, metrics are returned in text format of Prometheus on any path.
+    """
+
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self) -> None:
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logging.debug("Metrics request from %s: %s", self.address_string(), format % args)
+
+
+def dump_metrics(path: str, registry: Optional[MetricsRegistry] = None) -> None:
+    """
+    Function writes metrics in text format of Prometheus to file. File is replaced at once, so reader never sees
+    partially written file.
+    :param path: path to file;
+    :param registry: registry of metrics, by default it is default registry.
+    """
+
+    registry = registry or REGISTRY
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".metrics")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            file.write(registry.render())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def start_metrics_server(port: int, host: str = HOST, registry: Optional[MetricsRegistry] = None
+                         ) -> ThreadingHTTPServer:
+    """
+    Function starts HTTP server with metrics in daemon thread. By default server accepts only local connections.
+    :param port: port of server, if it is 0, free port is chosen;
+    :param host: address of server;
+    :param registry: registry of metrics, by default it is default registry.
+    :return: server, it should be stopped with shutdown method.
+    """
+
+    handler = type("RegistryRequestHandler", (MetricsRequestHandler,), {"registry": registry or REGISTRY})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logging.info("Metrics are available at http://%s:%d/metrics", host, server.server_address[1])
+    return server
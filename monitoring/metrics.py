@@ -0,0 +1,302 @@
+import bisect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+FAST_BUCKETS: Tuple[float, ...] = (0.000005, 0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01)
+PREFIX: str = "tic_tac_toe_"
+
+
+def _format_value(value: float) -> str:
+    """
+    Function formats value of metric for text format of Prometheus.
+    :param value: value.
+    :return: string value.
+    """
+
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """
+    Base class for metric. Value of metric is changed under lock, because metrics are updated from threads of GUI,
+    server, client and revealer.
+    """
+
+    TYPE: str = "untyped"
+
+    def __init__(self, name: str, description: str) -> None:
+        """
+        :param name: name of metric;
+        :param description: description of metric.
+        """
+
+        self._description: str = description
+        self._lock: threading.Lock = threading.Lock()
+        self._name: str = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @abstractmethod
+    def get_samples(self) -> List[Tuple[str, float]]:
+        """
+        Method returns samples of metric.
+        :return: list of names of samples with labels and values.
+        """
+
+    def render(self) -> str:
+        """
+        Method returns metric in text format of Prometheus.
+        :return: text.
+        """
+
+        lines = [f"# HELP {self._name} {self._description}", f"# TYPE {self._name} {self.TYPE}"]
+        lines.extend(f"{name} {_format_value(value)}" for name, value in self.get_samples())
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """
+    Class for counter, value of counter only increases.
+    """
+
+    TYPE: str = "counter"
+
+    def __init__(self, name: str, description: str) -> None:
+        super().__init__(name, description)
+        self._value: float = 0
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def get_samples(self) -> List[Tuple[str, float]]:
+        return [(self._name, self._value)]
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Method increases counter.
+        :param amount: amount to add, should not be negative.
+        """
+
+        if amount < 0:
+            raise ValueError("Counter can not be decreased")
+        with self._lock:
+            self._value += amount
+
+
+class Gauge(Metric):
+    """
+    Class for gauge, value of gauge can go up and down.
+    """
+
+    TYPE: str = "gauge"
+
+    def __init__(self, name: str, description: str) -> None:
+        super().__init__(name, description)
+        self._value: float = 0
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def get_samples(self) -> List[Tuple[str, float]]:
+        return [(self._name, self._value)]
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+
+class Histogram(Metric):
+    """
+    Class for histogram with fixed buckets. Observation is counted only in the first bucket whose upper bound is not
+    less than value, cumulative counts are calculated when histogram is rendered.
+    """
+
+    TYPE: str = "histogram"
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        :param name: name of metric;
+        :param description: description of metric;
+        :param buckets: sorted upper bounds of buckets, bucket for infinity is added automatically.
+        """
+
+        super().__init__(name, description)
+        if list(buckets) != sorted(buckets):
+            raise ValueError("Buckets of histogram should be sorted")
+        self._bounds: List[float] = [bound for bound in buckets if not math.isinf(bound)]
+        self._counts: List[int] = [0] * (len(self._bounds) + 1)
+        self._sum: float = 0
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def get_samples(self) -> List[Tuple[str, float]]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        samples = []
+        cumulative_count = 0
+        for bound, count in zip(self._bounds + [math.inf], counts):
+            cumulative_count += count
+            samples.append((f'{self._name}_bucket{{le="{_format_value(bound)}"}}', cumulative_count))
+        samples.append((f"{self._name}_sum", total))
+        samples.append((f"{self._name}_count", cumulative_count))
+        return samples
+
+    def observe(self, value: float) -> None:
+        """
+        Method adds observation to histogram.
+        :param value: observed value.
+        """
+
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def time(self) -> "Timer":
+        """
+        Method returns context manager that observes duration of its block in seconds.
+        :return: context manager.
+        """
+
+        return Timer(self)
+
+
+class Timer:
+    """
+    Context manager that adds duration of its block to histogram.
+    """
+
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram: Histogram = histogram
+        self._start_time: float = 0
+
+    def __enter__(self) -> "Timer":
+        self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._histogram.observe(time.perf_counter() - self._start_time)
+
+
+class MetricsRegistry:
+    """
+    Class for registry of metrics. Metric is created once and then the same object is returned by name, so modules
+    can declare metrics they update at import.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._metrics: Dict[str, Metric] = {}
+
+    def _get_or_create(self, metric_type: type, name: str, description: str, *args) -> Metric:
+        """
+        Method returns metric with given name, metric is created if it is not registered yet.
+        :param metric_type: class of metric;
+        :param name: name of metric without prefix;
+        :param description: description of metric;
+        :param args: other arguments of metric.
+        :return: metric.
+        """
+
+        name = PREFIX + name
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_type(name, description, *args)
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_type):
+                raise ValueError(f"Metric '{name}' is already registered with type {metric.TYPE}")
+        return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        return self._get_or_create(Gauge, name, description)
+
+    def get(self, name: str) -> Optional[Metric]:
+        """
+        Method returns registered metric.
+        :param name: name of metric with or without prefix.
+        :return: metric or None if it is not registered.
+        """
+
+        return self._metrics.get(name if name.startswith(PREFIX) else PREFIX + name)
+
+    def histogram(self, name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, description, buckets)
+
+    def render(self) -> str:
+        """
+        Method returns all metrics in text format of Prometheus.
+        :return: text.
+        """
+
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return "".join(metric.render() for metric in metrics)
+
+
+REGISTRY: MetricsRegistry = MetricsRegistry()
+
+
+def counter(name: str, description: str) -> Counter:
+    """
+    Function returns counter from default registry.
+    :param name: name of counter without prefix;
+    :param description: description of counter.
+    :return: counter.
+    """
+
+    return REGISTRY.counter(name, description)
+
+
+def gauge(name: str, description: str) -> Gauge:
+    """
+    Function returns gauge from default registry.
+    :param name: name of gauge without prefix;
+    :param description: description of gauge.
+    :return: gauge.
+    """
+
+    return REGISTRY.gauge(name, description)
+
+
+def histogram(name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    """
+    Function returns histogram from default registry.
+    :param name: name of histogram without prefix;
+    :param description: description of histogram;
+    :param buckets: upper bounds of buckets.
+    :return: histogram.
+    """
+
+    return REGISTRY.histogram(name, description, buckets)
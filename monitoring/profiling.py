@@ -0,0 +1,150 @@
+import argparse
+import cProfile
+import functools
+import logging
+import os
+import threading
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, Iterable
+from monitoring import tracing
+
+
+DEFAULT_DIRECTORY: str = "profiles"
+SUBSYSTEMS: Dict[str, str] = {"ai": "choice of move by computer",
+                              "discovery": "search of players in local network",
+                              "messages": "handling of messages by server",
+                              "win_check": "check of playing field for finish"}
+
+
+class ProfiledSection:
+    """
+    Context manager that profiles its block with profiler of subsystem. Since Python 3.12 cProfile is built on
+    sys.monitoring, which is shared by all threads, so only one profiler can be enabled in process. Block is not
+    profiled if another section in any thread is already active, and profile of block can include calls made by
+    other threads while block runs.
+    """
+
+    _lock: threading.Lock = threading.Lock()
+
+    def __init__(self, profiler: cProfile.Profile) -> None:
+        self._enabled: bool = False
+        self._profiler: cProfile.Profile = profiler
+
+    def __enter__(self) -> "ProfiledSection":
+        if self._lock.acquire(blocking=False):
+            try:
+                self._profiler.enable()
+                self._enabled = True
+            except ValueError as exc:
+                logging.debug("Failed to enable profiler: %s", exc)
+                self._lock.release()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._enabled:
+            self._profiler.disable()
+            self._enabled = False
+            self._lock.release()
+
+
+_NULL_CONTEXT: ContextManager = nullcontext()
+_directory: str = DEFAULT_DIRECTORY
+_profilers: Dict[str, cProfile.Profile] = {}
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Function adds options of profiling and tracing to parser of command line. By default options are taken from
+    environment variables.
+    :param parser: parser of command line.
+    """
+
+    parser.add_argument("--profile", default=os.environ.get("TIC_TAC_TOE_PROFILE"),
+                        help="comma-separated subsystems to profile with cProfile or 'all', subsystems: " +
+                             ", ".join(SUBSYSTEMS) + " (TIC_TAC_TOE_PROFILE)")
+    parser.add_argument("--profile-dir", default=os.environ.get("TIC_TAC_TOE_PROFILE_DIR", DEFAULT_DIRECTORY),
+                        help="directory to save profiles of subsystems to (TIC_TAC_TOE_PROFILE_DIR)")
+    parser.add_argument("--trace", default=os.environ.get("TIC_TAC_TOE_TRACE"),
+                        help="file to save spans of hot paths to in Chrome trace event format (TIC_TAC_TOE_TRACE)")
+
+
+def enable(subsystems: Iterable[str], directory: str = DEFAULT_DIRECTORY) -> None:
+    """
+    Function turns on profiling of subsystems.
+    :param subsystems: names of subsystems from SUBSYSTEMS;
+    :param directory: directory to save profiles to.
+    """
+
+    global _directory
+    unknown_subsystems = set(subsystems) - set(SUBSYSTEMS)
+    if unknown_subsystems:
+        raise ValueError(f"Unknown subsystems to profile: {', '.join(sorted(unknown_subsystems))}")
+    _directory = directory
+    for subsystem in subsystems:
+        _profilers.setdefault(subsystem, cProfile.Profile())
+
+
+def is_enabled() -> bool:
+    return bool(_profilers) or tracing.is_enabled()
+
+
+def profile(subsystem: str) -> ContextManager:
+    """
+    Function returns context manager that profiles its block if profiling of subsystem is turned on, otherwise
+    context manager does nothing.
+    :param subsystem: name of subsystem.
+    :return: context manager.
+    """
+
+    profiler = _profilers.get(subsystem)
+    if profiler is None:
+        return _NULL_CONTEXT
+    return ProfiledSection(profiler)
+
+
+def profiled(subsystem: str) -> Callable[[Callable], Callable]:
+    """
+    Function returns decorator that profiles every call of function if profiling of subsystem is turned on.
+    :param subsystem: name of subsystem.
+    :return: decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with profile(subsystem):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def save() -> None:
+    """
+    Function saves profiles of subsystems to files <subsystem>.prof, which can be read with pstats or snakeviz, and
+    saves trace.
+    """
+
+    if _profilers:
+        try:
+            os.makedirs(_directory, exist_ok=True)
+            for subsystem, profiler in _profilers.items():
+                profiler.dump_stats(os.path.join(_directory, f"{subsystem}.prof"))
+            logging.info("Profiles of %s were saved to %s", ", ".join(_profilers), _directory)
+        except OSError as exc:
+            logging.error("Failed to save profiles to %s: %s", _directory, exc)
+    tracing.save()
+
+
+def setup(args: argparse.Namespace) -> None:
+    """
+    Function turns on profiling and tracing with options added by add_arguments.
+    :param args: options of command line.
+    """
+
+    if args.profile:
+        subsystems = SUBSYSTEMS if args.profile == "all" else [name.strip() for name in args.profile.split(",")]
+        enable(subsystems, args.profile_dir)
+    if args.trace:
+        tracing.enable(args.trace)
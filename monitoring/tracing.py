@@ -0,0 +1,149 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+
+class Tracer:
+    """
+    Class for tracer that records spans as complete events of Chrome trace event format. Saved file can be opened in
+    chrome://tracing or Perfetto. Events are kept in memory until tracer is saved, tracer stops recording when
+    MAX_EVENTS events are recorded.
+    """
+
+    MAX_EVENTS: int = 1000000
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: path to file to save trace.
+        """
+
+        self._events: List[Dict[str, Any]] = []
+        self._origin: float = time.perf_counter()
+        self._path: str = path
+        self._pid: int = os.getpid()
+        self._thread_ids: Dict[int, str] = {}
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def add_span(self, name: str, category: str, start_time: float, end_time: float) -> None:
+        """
+        Method records span.
+        :param name: name of span;
+        :param category: category of span;
+        :param start_time: start time of span from time.perf_counter;
+        :param end_time: end time of span from time.perf_counter.
+        """
+
+        if len(self._events) >= self.MAX_EVENTS:
+            return
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_ids:
+            self._thread_ids[thread_id] = threading.current_thread().name
+        self._events.append({"name": name, "cat": category, "ph": "X", "pid": self._pid, "tid": thread_id,
+                             "ts": (start_time - self._origin) * 1e6, "dur": (end_time - start_time) * 1e6})
+
+    def save(self) -> None:
+        """
+        Method writes recorded spans and names of threads to file.
+        """
+
+        metadata = [{"name": "thread_name", "ph": "M", "pid": self._pid, "tid": thread_id, "args": {"name": name}}
+                    for thread_id, name in list(self._thread_ids.items())]
+        with open(self._path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": metadata + self._events[:], "displayTimeUnit": "ms"}, file)
+        logging.info("Trace with %d spans was saved to %s", len(self._events), self._path)
+
+
+class Span:
+    """
+    Context manager that records its block as span.
+    """
+
+    def __init__(self, tracer: Tracer, name: str, category: str) -> None:
+        self._category: str = category
+        self._name: str = name
+        self._start_time: float = 0
+        self._tracer: Tracer = tracer
+
+    def __enter__(self) -> "Span":
+        self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._tracer.add_span(self._name, self._category, self._start_time, time.perf_counter())
+
+
+_NULL_CONTEXT: ContextManager = nullcontext()
+_tracer: Optional[Tracer] = None
+
+
+def enable(path: str) -> None:
+    """
+    Function starts recording of spans.
+    :param path: path to file to save trace.
+    """
+
+    global _tracer
+    _tracer = Tracer(path)
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def save() -> None:
+    """
+    Function saves recorded spans if tracing is enabled.
+    """
+
+    if _tracer is not None:
+        try:
+            _tracer.save()
+        except OSError as exc:
+            logging.error("Failed to save trace to %s: %s", _tracer.path, exc)
+
+
+def span(name: str, category: str) -> ContextManager:
+    """
+    Function returns context manager that records its block as span. If tracing is disabled, context manager does
+    nothing.
+    :param name: name of span;
+    :param category: category of span.
+    :return: context manager.
+    """
+
+    if _tracer is None:
+        return _NULL_CONTEXT
+    return Span(_tracer, name, category)
+
+
+def traced(name: str, category: str) -> Callable[[Callable], Callable]:
+    """
+    Function returns decorator that records every call of function as span when tracing is enabled.
+    :param name: name of span;
+    :param category: category of span.
+    :return: decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return function(*args, **kwargs)
+            start_time = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                tracer.add_span(name, category, start_time, time.perf_counter())
+
+        return wrapper
+
+    return decorator
@@ -1,5 +1,8 @@
+from revealer.neighbours import NeighbourProvider, StaticNeighbourProvider, SystemNeighbourProvider
+from revealer.presence import PresenceCache
 from revealer.revealer_client import RevealerClient
 from revealer.revealer_server import RevealerServer
 
 
-__all__ = ["RevealerClient", "RevealerServer"]
+__all__ = ["NeighbourProvider", "PresenceCache", "RevealerClient", "RevealerServer", "StaticNeighbourProvider",
+           "SystemNeighbourProvider"]
@@ -0,0 +1,137 @@
+import ipaddress
+import logging
+import os
+import re
+import subprocess
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+from revealer.utils import get_network_interfaces
+
+
+class NeighbourProvider(ABC):
+    """
+    Base class for providers of IP addresses of hosts in local network.
+    """
+
+    @abstractmethod
+    def get_addresses(self) -> List[str]:
+        """
+        Method returns IP addresses of hosts in local network.
+        :return: list of IP addresses.
+        """
+
+
+class StaticNeighbourProvider(NeighbourProvider):
+    """
+    Class for provider that returns given addresses. It is used to test and benchmark discovery without network.
+    """
+
+    def __init__(self, addresses: Iterable[str]) -> None:
+        """
+        :param addresses: IP addresses of hosts.
+        """
+
+        self._addresses: List[str] = list(addresses)
+
+    def get_addresses(self) -> List[str]:
+        return list(self._addresses)
+
+
+class SystemNeighbourProvider(NeighbourProvider):
+    """
+    Class for provider that reads neighbour table of operating system. On Linux table is read from /proc/net/arp,
+    on other systems output of "arp -a" is parsed. Table is cached and read again only after refresh interval. If
+    table is empty, all addresses of subnets of network interfaces are returned.
+    """
+
+    ARP_COMMAND_TIMEOUT: float = 2
+    ARP_TABLE_PATH: str = "/proc/net/arp"
+    INCOMPLETE_FLAGS: int = 0
+    REFRESH_INTERVAL: float = 5
+    SUBNET_PREFIX_LENGTH: int = 24
+
+    def __init__(self, refresh_interval: float = REFRESH_INTERVAL,
+                 subnet_prefix_length: int = SUBNET_PREFIX_LENGTH) -> None:
+        """
+        :param refresh_interval: time in seconds during which cached table is used;
+        :param subnet_prefix_length: min length of network prefix of subnets which addresses are returned when
+        neighbour table is empty.
+        """
+
+        self._addresses: List[str] = []
+        self._refresh_interval: float = refresh_interval
+        self._refresh_time: Optional[float] = None
+        self._subnet_prefix_length: int = subnet_prefix_length
+
+    def _get_subnet_addresses(self) -> List[str]:
+        """
+        Method returns all addresses of subnets of network interfaces except own addresses. Large networks are
+        limited to subnet with min prefix length around own address.
+        :return: list of IP addresses.
+        """
+
+        interfaces = [interface for interface in get_network_interfaces() if not interface.is_loopback]
+        own_addresses = {interface.address for interface in interfaces}
+        addresses = set()
+        for interface in interfaces:
+            prefix_length = max(interface.prefix_length, self._subnet_prefix_length)
+            network = ipaddress.ip_network(f"{interface.address}/{prefix_length}", strict=False)
+            addresses.update(str(address) for address in network.hosts())
+        return sorted(addresses - own_addresses, key=ipaddress.ip_address)
+
+    def _read_arp_command(self) -> List[str]:
+        """
+        Method parses output of "arp -a" command.
+        :return: list of IP addresses.
+        """
+
+        try:
+            output = subprocess.run(["arp", "-a"], capture_output=True, text=True, timeout=self.ARP_COMMAND_TIMEOUT,
+                                    check=False).stdout
+        except (OSError, subprocess.SubprocessError) as exc:
+            logging.debug("Failed to run arp command: %s", exc)
+            return []
+        addresses = set()
+        for line in output.splitlines():
+            match_result = re.match(r"^.*?\(?(?P<address>(\d{1,3}\.){3}\d{1,3})\)? .*$", line)
+            if match_result:
+                addresses.add(match_result.group("address"))
+        return sorted(addresses)
+
+    def _read_arp_table(self) -> List[str]:
+        """
+        Method reads neighbour table from /proc/net/arp. Entries without resolved hardware address are skipped.
+        :return: list of IP addresses.
+        """
+
+        addresses = set()
+        with open(self.ARP_TABLE_PATH, "r", encoding="utf-8") as file:
+            next(file, None)
+            for line in file:
+                fields = line.split()
+                if len(fields) >= 3 and int(fields[2], 16) != self.INCOMPLETE_FLAGS:
+                    addresses.add(fields[0])
+        return sorted(addresses)
+
+    def get_addresses(self) -> List[str]:
+        now = time.monotonic()
+        if self._refresh_time is None or now - self._refresh_time >= self._refresh_interval:
+            self._addresses = self.read_neighbour_table()
+            self._refresh_time = now
+        if not self._addresses:
+            return self._get_subnet_addresses()
+        return list(self._addresses)
+
+    def read_neighbour_table(self) -> List[str]:
+        """
+        Method reads neighbour table of operating system without cache.
+        :return: list of IP addresses.
+        """
+
+        if os.path.exists(self.ARP_TABLE_PATH):
+            try:
+                return self._read_arp_table()
+            except (OSError, ValueError) as exc:
+                logging.debug("Failed to read %s: %s", self.ARP_TABLE_PATH, exc)
+        return self._read_arp_command()
@@ -1,2 +1,6 @@
+ANNOUNCE_PORT: int = 6970
+BROADCAST_ADDRESS: str = "255.255.255.255"
+DISCOVERY_MESSAGE: bytes = b"DISCOVER_TIC_TAC_TOE"
+LEAVE_MESSAGE: bytes = b"LEAVE_TIC_TAC_TOE"
 REVEALER_PORT: int = 6969
 SIZE: int = 1024
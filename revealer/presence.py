@@ -0,0 +1,75 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class PresenceCache:
+    """
+    Class for cache of players found in local network. For every address login of player and time when player was
+    seen last are kept. Player that was not seen during time to live is considered to have left.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        :param ttl: time to live of player in seconds.
+        """
+
+        self._players: Dict[str, Tuple[str, float]] = {}
+        self._ttl: float = ttl
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._players
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def get_login(self, address: str) -> Optional[str]:
+        """
+        Method returns login of player.
+        :param address: IP address of player.
+        :return: login or None if player is not in cache.
+        """
+
+        player = self._players.get(address)
+        return player[0] if player else None
+
+    def remove(self, address: str) -> bool:
+        """
+        Method removes player from cache.
+        :param address: IP address of player.
+        :return: True if player was in cache.
+        """
+
+        return self._players.pop(address, None) is not None
+
+    def remove_expired(self, now: Optional[float] = None) -> List[str]:
+        """
+        Method removes players that were not seen during time to live.
+        :param now: current time from time.monotonic().
+        :return: list of IP addresses of removed players.
+        """
+
+        if now is None:
+            now = time.monotonic()
+        expired = [address for address, (_, last_seen) in self._players.items() if now - last_seen > self._ttl]
+        for address in expired:
+            del self._players[address]
+        return expired
+
+    def update(self, address: str, login: str, now: Optional[float] = None) -> bool:
+        """
+        Method saves that player was seen.
+        :param address: IP address of player;
+        :param login: login of player;
+        :param now: current time from time.monotonic().
+        :return: True if player is new or changed login.
+        """
+
+        if now is None:
+            now = time.monotonic()
+        changed = self.get_login(address) != login
+        self._players[address] = login, now
+        return changed
@@ -3,25 +3,110 @@ import re
 import select
 import socket
 import time
-from datetime import datetime, timedelta
+from typing import Optional, Set
 from PyQt5.QtCore import pyqtSignal, QThread
-from revealer.params import REVEALER_PORT, SIZE
-from revealer.utils import get_local_network_ip_addresses
+from monitoring import metrics, profiling, tracing
+from revealer.neighbours import NeighbourProvider, SystemNeighbourProvider
+from revealer.params import ANNOUNCE_PORT, BROADCAST_ADDRESS, DISCOVERY_MESSAGE, LEAVE_MESSAGE, REVEALER_PORT, SIZE
+from revealer.presence import PresenceCache
+from revealer.utils import get_broadcast_addresses, get_network_interfaces
+
+
+ANNOUNCEMENTS: metrics.Counter = metrics.counter("announcements_received_total",
+                                                 "Number of announcements of revealer servers received")
+DISCOVERY_REPLIES: metrics.Counter = metrics.counter("discovery_replies_total",
+                                                     "Number of replies to discovery requests")
+DISCOVERY_SWEEPS: metrics.Counter = metrics.counter("discovery_sweeps_total", "Number of searches of players")
+DISCOVERY_SWEEP_TIME: metrics.Histogram = metrics.histogram("discovery_sweep_seconds",
+                                                            "Time to send discovery requests and collect replies")
+PLAYERS: metrics.Gauge = metrics.gauge("players", "Number of players found in local network")
 
 
 class RevealerClient(QThread):
     """
-    Class for revealer client to search other players in local network.
+    Class for revealer client to search other players in local network. Found players are kept in presence cache.
+    Client listens to announcements that revealer servers send when they start, change login, stop and from time to
+    time while running, so requests to all hosts in network are sent more and more rarely.
     """
 
+    MAX_PROBE_INTERVAL: float = 20
+    PROBE_INTERVAL: float = 0.5
+    TIMEOUT: float = 0.2
+    TTL: float = 30
+    WAIT_INTERVAL: float = 1
     player_found: pyqtSignal = pyqtSignal(str, str)
-    search_completed: pyqtSignal = pyqtSignal()
-    search_started: pyqtSignal = pyqtSignal()
+    player_lost: pyqtSignal = pyqtSignal(str)
+
+    def __init__(self, neighbour_provider: Optional[NeighbourProvider] = None) -> None:
+        """
+        :param neighbour_provider: provider of addresses of hosts in local network to send requests to, by default
+        neighbour table of operating system is used.
+        """
 
-    def __init__(self) -> None:
         super().__init__()
+        self._announce_port: int = ANNOUNCE_PORT
+        self._neighbour_provider: NeighbourProvider = neighbour_provider or SystemNeighbourProvider()
+        self._own_addresses: Set[str] = {interface.address for interface in get_network_interfaces()}
+        self._presence: PresenceCache = PresenceCache(self.TTL)
         self.stop_search: bool = False
 
+    def _create_announcement_socket(self) -> Optional[socket.socket]:
+        """
+        Method creates socket to receive announcements of revealer servers.
+        :return: socket or None if socket failed to bind to port of announcements.
+        """
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.bind(("", self._announce_port))
+        except OSError as exc:
+            logging.warning("Revealer client can't listen to announcements on port %d: %s", self._announce_port, exc)
+            sock.close()
+            return None
+        return sock
+
+    def _handle_announcement(self, sock: socket.socket) -> None:
+        """
+        Method receives announcement of revealer server and updates presence cache.
+        :param sock: socket to receive announcements.
+        """
+
+        try:
+            data, address = sock.recvfrom(SIZE)
+        except OSError as exc:
+            logging.debug("Failed to receive announcement: %s", exc)
+            return
+        ANNOUNCEMENTS.inc()
+        if data.startswith(LEAVE_MESSAGE):
+            if self._presence.remove(address[0]):
+                PLAYERS.set(len(self._presence))
+                self.player_lost.emit(address[0])
+        elif data.startswith(DISCOVERY_MESSAGE):
+            self._update_player(address[0], data)
+
+    def _remove_expired_players(self) -> None:
+        for address in self._presence.remove_expired():
+            self.player_lost.emit(address)
+        PLAYERS.set(len(self._presence))
+
+    def _update_player(self, address: str, data: bytes) -> None:
+        """
+        Method saves player in presence cache and reports new player or player with new login. Revealer server of
+        this application answers broadcast requests too, so responses from own addresses are ignored.
+        :param address: IP address of player;
+        :param data: revealer server response or announcement.
+        """
+
+        if address in self._own_addresses:
+            return
+        login = self._parse_login(data)
+        if self._presence.update(address, login):
+            PLAYERS.set(len(self._presence))
+            self.player_found.emit(address, login)
+
     @staticmethod
     def _parse_login(data: bytes) -> str:
         """
@@ -30,50 +115,72 @@ class RevealerClient(QThread):
         :return: player login on revealer server.
         """
 
-        data = data.decode("utf-8")
+        data = data.decode("utf-8", errors="replace")
         result = re.match(r"^DISCOVER_TIC_TAC_TOE (.*)$", data)
         if result:
             return result.group(1)
         return ""
 
+    @tracing.traced("RevealerClient._reveal", "revealer")
+    @profiling.profiled("discovery")
     def _reveal(self, timeout: float = None) -> None:
         """
-        Method detects available players in local network.
+        Method detects available players in local network. Requests are sent to all known addresses in local network
+        and to broadcast addresses of all network interfaces from one socket at once, then responses are collected
+        during one waiting time, so search takes the same time regardless of number of hosts in network.
         :param timeout: max waiting time for responses.
         """
 
-        waiting_time = 0.1
         if timeout is None:
-            timeout = waiting_time
-        timeout = timedelta(seconds=timeout)
-        for local_address in get_local_network_ip_addresses():
-            if self.stop_search:
-                return
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-                    sock.sendto("DISCOVER_TIC_TAC_TOE".encode(), (local_address, REVEALER_PORT))
-                    time_end = datetime.utcnow() + timeout
-                    while True:
-                        if self.stop_search:
-                            return
-                        time_now = datetime.utcnow()
-                        time_left = (time_end - time_now).total_seconds()
-                        if time_left < 0:
-                            break
-                        ready = select.select([sock], [], [], time_left)
-                        if ready[0]:
-                            data, address = sock.recvfrom(SIZE)
-                            if data.startswith("DISCOVER_TIC_TAC_TOE".encode()):
-                                self.player_found.emit(str(address[0]), self._parse_login(data))
-            except Exception as exc:
-                logging.debug("Failed to connect to address %s: %s", local_address, exc)
+            timeout = self.TIMEOUT
+        start_time = time.perf_counter()
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            for address in [BROADCAST_ADDRESS, *get_broadcast_addresses(), *self._neighbour_provider.get_addresses()]:
+                try:
+                    sock.sendto(DISCOVERY_MESSAGE, (address, REVEALER_PORT))
+                except OSError as exc:
+                    logging.debug("Failed to send request to address %s: %s", address, exc)
+            found_addresses = set()
+            time_end = time.monotonic() + timeout
+            while not self.stop_search:
+                time_left = time_end - time.monotonic()
+                if time_left <= 0:
+                    break
+                if not select.select([sock], [], [], time_left)[0]:
+                    continue
+                try:
+                    data, address = sock.recvfrom(SIZE)
+                except OSError as exc:
+                    logging.debug("Failed to receive response: %s", exc)
+                    continue
+                if data.startswith(DISCOVERY_MESSAGE) and address[0] not in found_addresses:
+                    found_addresses.add(address[0])
+                    self._update_player(str(address[0]), data)
+        DISCOVERY_REPLIES.inc(len(found_addresses))
+        DISCOVERY_SWEEPS.inc()
+        DISCOVERY_SWEEP_TIME.observe(time.perf_counter() - start_time)
 
     def run(self) -> None:
-        while True:
-            self.search_started.emit()
-            self._reveal()
-            self.search_completed.emit()
-            time.sleep(0.5)
+        announcement_socket = self._create_announcement_socket()
+        max_probe_interval = self.MAX_PROBE_INTERVAL if announcement_socket else self.PROBE_INTERVAL
+        probe_interval = self.PROBE_INTERVAL
+        next_probe_time = time.monotonic()
+        try:
+            while not self.stop_search:
+                if time.monotonic() >= next_probe_time:
+                    self._reveal()
+                    next_probe_time = time.monotonic() + probe_interval
+                    probe_interval = min(2 * probe_interval, max_probe_interval)
+                time_left = min(max(next_probe_time - time.monotonic(), 0), self.WAIT_INTERVAL)
+                if announcement_socket is None:
+                    time.sleep(time_left)
+                elif select.select([announcement_socket], [], [], time_left)[0]:
+                    self._handle_announcement(announcement_socket)
+                self._remove_expired_players()
+        finally:
+            if announcement_socket is not None:
+                announcement_socket.close()
 
     def stop(self) -> None:
         """
@@ -1,29 +1,94 @@
 import logging
+import select
 import socket
+import time
+from typing import List, Optional
 from PyQt5.QtCore import QThread
-from revealer.params import REVEALER_PORT, SIZE
-from revealer.utils import get_ip_address
+from monitoring import metrics
+from revealer.params import ANNOUNCE_PORT, BROADCAST_ADDRESS, DISCOVERY_MESSAGE, LEAVE_MESSAGE, REVEALER_PORT, SIZE
+from revealer.utils import get_broadcast_addresses, get_network_interfaces
+
+
+DISCOVERY_REQUESTS: metrics.Counter = metrics.counter("discovery_requests_total",
+                                                      "Number of discovery requests answered by revealer server")
 
 
 class RevealerServer(QThread):
     """
-    Class for revealer server to send its information to other players.
+    Class for revealer server to send its information to other players. Server answers requests of revealer clients
+    and announces itself to local network when it starts, when login changes, when it stops and periodically while
+    it runs.
     """
 
-    def __init__(self) -> None:
+    ANNOUNCE_INTERVAL: float = 10
+
+    def __init__(self, hosts: Optional[List[str]] = None) -> None:
+        """
+        :param hosts: IP addresses of network interfaces to answer requests on, by default server answers on all
+        interfaces.
+        """
+
         super().__init__()
-        self._host: str = get_ip_address()
+        self._announce_addresses: Optional[List[str]] = None
+        self._announce_port: int = ANNOUNCE_PORT
+        self._hosts: List[str] = hosts or [""]
         self._port: int = REVEALER_PORT
         self._login: str = None
-        self._socket: socket.socket = None
+        self._sockets: List[socket.socket] = []
         self._stop: bool = False
 
+    def _announce(self, message: bytes) -> None:
+        """
+        Method sends announcement to revealer clients in networks of interfaces of server.
+        :param message: announcement.
+        """
+
+        for host, sock in zip(self._hosts, self._sockets):
+            for address in self._get_announce_addresses(host):
+                try:
+                    sock.sendto(message, (address, self._announce_port))
+                except OSError as exc:
+                    logging.debug("Revealer server failed to send announcement to %s: %s", address, exc)
+
+    def _get_announce_addresses(self, host: str) -> List[str]:
+        """
+        Method returns broadcast addresses to send announcements from socket bound to host.
+        :param host: IP address socket is bound to.
+        :return: list of broadcast addresses.
+        """
+
+        if self._announce_addresses is not None:
+            return self._announce_addresses
+        if host:
+            addresses = [interface.broadcast_address for interface in get_network_interfaces()
+                         if interface.address == host and not interface.is_loopback]
+        else:
+            addresses = get_broadcast_addresses()
+        return addresses or [BROADCAST_ADDRESS]
+
+    def _get_presence_message(self) -> bytes:
+        return DISCOVERY_MESSAGE + f" {self._login if self._login else ''}".encode("utf-8")
+
+    def _handle_request(self, sock: socket.socket) -> None:
+        """
+        Method answers request of revealer client.
+        :param sock: socket that received request.
+        """
+
+        data, address = sock.recvfrom(SIZE)
+        if data.startswith(DISCOVERY_MESSAGE):
+            sock.sendto(self._get_presence_message(), address)
+            DISCOVERY_REQUESTS.inc()
+
     def close_server(self) -> None:
         """
         Method closes revealer server.
         """
 
-        self._socket.close()
+        self._stop = True
+        self._announce(LEAVE_MESSAGE)
+        for sock in self._sockets:
+            sock.close()
         logging.info("Revealer server was closed")
         self.quit()
 
@@ -33,25 +98,32 @@ class RevealerServer(QThread):
         """
 
         if not self.start_server():
-            logging.error("Revealer server failed to start on address (%s, %d)", self._host, self._port)
+            logging.error("Revealer server failed to start on addresses %s, port %d", self._hosts, self._port)
             return
-        logging.info("Revealer server running on address (%s, %d)", self._host, self._port)
+        logging.info("Revealer server running on addresses %s, port %d", self._hosts, self._port)
+        self._announce(self._get_presence_message())
+        next_announce_time = time.monotonic() + self.ANNOUNCE_INTERVAL
         while not self._stop:
             try:
-                data, address = self._socket.recvfrom(SIZE)
-                if data.startswith(b"DISCOVER_TIC_TAC_TOE"):
-                    self._socket.sendto(f"DISCOVER_TIC_TAC_TOE {self._login if self._login else ''}".encode("utf-8"),
-                                        address)
-            except Exception:
-                pass
+                time_left = max(next_announce_time - time.monotonic(), 0)
+                for sock in select.select(self._sockets, [], [], time_left)[0]:
+                    self._handle_request(sock)
+            except (OSError, ValueError):
+                continue
+            if time.monotonic() >= next_announce_time:
+                self._announce(self._get_presence_message())
+                next_announce_time = time.monotonic() + self.ANNOUNCE_INTERVAL
 
     def set_login(self, login: str) -> None:
         """
-        Method sets login for player.
+        Method sets login for player and announces it. Login is cut so that presence message fits in one datagram
+        that revealer clients receive.
         :param login: login.
         """
 
-        self._login = login
+        max_size = SIZE - len(DISCOVERY_MESSAGE) - 1
+        self._login = login.encode("utf-8")[:max_size].decode("utf-8", errors="ignore")
+        self._announce(self._get_presence_message())
 
     def start_server(self) -> bool:
         """
@@ -60,8 +132,14 @@ class RevealerServer(QThread):
         """
 
         try:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._socket.bind((self._host, self._port))
+            for host in self._hosts:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._sockets.append(sock)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+                sock.bind((host, self._port))
             return True
-        except Exception:
+        except OSError:
+            for sock in self._sockets:
+                sock.close()
+            self._sockets = []
             return False
@@ -1,36 +1,98 @@
+import ipaddress
 import logging
-import os
-import re
 import socket
-from typing import List
+import struct
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
-def get_ip_address() -> str:
+SIOCGIFADDR: int = 0x8915
+SIOCGIFNETMASK: int = 0x891B
+
+
+class NetworkInterface(NamedTuple):
+    """
+    IPv4 address of network interface.
+    """
+
+    name: str
+    address: str
+    prefix_length: int
+
+    @property
+    def broadcast_address(self) -> str:
+        return str(self.network.broadcast_address)
+
+    @property
+    def is_loopback(self) -> bool:
+        return ipaddress.ip_address(self.address).is_loopback
+
+    @property
+    def network(self) -> ipaddress.IPv4Network:
+        return ipaddress.ip_network(f"{self.address}/{self.prefix_length}", strict=False)
+
+
+def _get_interfaces_from_host_name() -> List[NetworkInterface]:
     """
-    Function returns IP address of server.
-    :return: IP address.
+    Function finds addresses of host by its name. Network masks are unknown, so prefix length 24 is assumed.
+    :return: list of interfaces.
     """
 
-    ip = ""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.connect(("8.8.8.8", 80))
-        ip = sock.getsockname()[0]
-    except Exception as exc:
-        logging.error("Server can't get IP address: %s", exc)
-    return ip
+        addresses = {info[4][0] for info in socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET)}
+    except OSError as exc:
+        logging.debug("Failed to resolve host name: %s", exc)
+        addresses = set()
+    addresses.add("127.0.0.1")
+    return [NetworkInterface("", address, 8 if address.startswith("127.") else 24) for address in sorted(addresses)]
+
+
+def _get_interfaces_from_kernel() -> List[NetworkInterface]:
+    """
+    Function asks kernel for addresses and network masks of interfaces with ioctl. It works on Linux.
+    :return: list of interfaces.
+    """
+
+    interfaces = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for _, name in socket.if_nameindex():
+            request = struct.pack("256s", name.encode("utf-8")[:15])
+            try:
+                address = socket.inet_ntoa(fcntl.ioctl(sock.fileno(), SIOCGIFADDR, request)[20:24])
+                netmask = socket.inet_ntoa(fcntl.ioctl(sock.fileno(), SIOCGIFNETMASK, request)[20:24])
+            except OSError:
+                continue
+            prefix_length = ipaddress.ip_network(f"0.0.0.0/{netmask}").prefixlen
+            interfaces.append(NetworkInterface(name, address, prefix_length))
+    return interfaces
+
+
+def get_broadcast_addresses() -> List[str]:
+    """
+    Function returns broadcast addresses of networks of interfaces except loopback.
+    :return: list of broadcast addresses.
+    """
+
+    return sorted({interface.broadcast_address for interface in get_network_interfaces() if not interface.is_loopback})
 
 
-def get_local_network_ip_addresses() -> List[str]:
+@lru_cache(maxsize=1)
+def get_network_interfaces() -> Tuple[NetworkInterface, ...]:
     """
-    Function returns IP addresses in local network.
-    :return: list of IP addresses in local network.
+    Function enumerates IPv4 addresses of network interfaces once, next calls return cached result.
+    :return: interfaces.
     """
 
-    results = os.popen("arp -a").read().split("\n")
-    ip_addresses = set()
-    for result in results:
-        match_result = re.match("^.* (?P<address>(\d{1,3}\.){3}\d{1,3}) .*$", result)
-        if match_result:
-            ip_addresses.add(match_result.group("address"))
-    return list(ip_addresses)
+    interfaces = []
+    if fcntl is not None and hasattr(socket, "if_nameindex"):
+        try:
+            interfaces = _get_interfaces_from_kernel()
+        except OSError as exc:
+            logging.debug("Failed to enumerate network interfaces: %s", exc)
+    if not interfaces:
+        interfaces = _get_interfaces_from_host_name()
+    return tuple(interfaces)
@@ -0,0 +1,4 @@
+cd ..
+venv\Scripts\python -m PyQt5.uic.pyuic media\main_window.ui -o gui\ui_main_window.py
+venv\Scripts\python -m PyQt5.uic.pyuic media\connection_window.ui -o gui\ui_connection_window.py
+pause
\ No newline at end of file
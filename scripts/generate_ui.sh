@@ -0,0 +1,3 @@
+cd ..
+./venv/bin/python3 -m PyQt5.uic.pyuic media/main_window.ui -o gui/ui_main_window.py
+./venv/bin/python3 -m PyQt5.uic.pyuic media/connection_window.ui -o gui/ui_connection_window.py
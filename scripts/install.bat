@@ -4,4 +4,5 @@ if exist venv rd /s/q venv
 %PYTHON% -m venv venv
 venv\Scripts\python -m pip install --upgrade pip
 venv\Scripts\python -m pip install -r requirements.txt
+venv\Scripts\python -m engine.solved_table
 pause
\ No newline at end of file
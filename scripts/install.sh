@@ -3,3 +3,4 @@ rm -rf venv
 python3 -m venv venv
 ./venv/bin/python3 -m pip install --upgrade pip
 ./venv/bin/python3 -m pip install -r requirements.txt
+./venv/bin/python3 -m engine.solved_table
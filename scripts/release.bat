@@ -10,6 +10,7 @@ if exist venv rd /s/q venv
 venv\Scripts\python -m pip install --upgrade pip
 venv\Scripts\python -m pip install -r requirements.txt
 venv\Scripts\python -m pip install pyinstaller
+venv\Scripts\python -m engine.solved_table
 
 venv\Scripts\pyinstaller main.py --clean --onefile ^
 --add-data "media\*;media" ^
@@ -8,6 +8,7 @@ python3 -m venv venv
 ./venv/bin/python3 -m pip install --upgrade pip
 ./venv/bin/python3 -m pip install -r requirements.txt
 ./venv/bin/python3 -m pip install pyinstaller
+./venv/bin/python3 -m engine.solved_table
 
 ./venv/bin/pyinstaller main.py --clean --onefile \
 --add-data "./media/*:media" \
@@ -0,0 +1,66 @@
+import unittest
+from typing import List
+from connection.live_game import LiveGame
+from connection.messenger import Messenger
+from connection.protocol import MessageProtocol
+
+
+class FakeSpectator:
+    """
+    Class for connection of spectator whose send queue can be made full.
+    """
+
+    def __init__(self) -> None:
+        self.dropped_messages_number: int = 0
+        self.full: bool = False
+        self.messages: List[str] = []
+        self.overflow_policy: str = MessageProtocol.DISCONNECT
+        self.protocol_version: int = Messenger.PROTOCOL_VERSION
+
+    def send_encoded_message(self, encoded_message: bytes) -> None:
+        if self.full:
+            self.dropped_messages_number += 1
+        else:
+            message = Messenger.decode_message(encoded_message[Messenger.HEADER.size:])
+            self.messages.append(message["MESSAGE"])
+
+
+class TestLiveGame(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.game = LiveGame(1, 3, 3)
+        self.spectator = FakeSpectator()
+        self.game.add_spectator(self.spectator)
+
+    def test_dropped_move_is_replaced_with_snapshot(self) -> None:
+        self.game.add_move(0, 0)
+        self.spectator.full = True
+        self.game.add_move(1, 1)
+        self.spectator.full = False
+        self.game.add_move(2, 0)
+        self.game.add_move(3, 1)
+        self.assertEqual(self.spectator.messages, ["Snapshot", "Move", "Snapshot", "Move"])
+
+    def test_dropped_snapshot_is_sent_again(self) -> None:
+        self.spectator.full = True
+        self.game.add_move(0, 0)
+        self.game.add_move(1, 1)
+        self.spectator.full = False
+        self.game.add_move(2, 0)
+        self.game.finish(0)
+        self.assertEqual(self.spectator.messages, ["Snapshot", "Snapshot", "Game over"])
+
+    def test_snapshot_of_late_spectator_contains_moves(self) -> None:
+        self.game.add_move(4, 0)
+        self.game.add_move(0, 1)
+        spectator = FakeSpectator()
+        encoded_messages = []
+        spectator.send_encoded_message = encoded_messages.append
+        self.game.add_spectator(spectator)
+        snapshot = Messenger.decode_message(encoded_messages[0][Messenger.HEADER.size:])
+        self.assertEqual(snapshot["MOVES"], [4, 0])
+        self.assertEqual(spectator.overflow_policy, MessageProtocol.DROP)
+
+
+if __name__ == "__main__":
+    unittest.main()
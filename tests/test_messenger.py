@@ -0,0 +1,35 @@
+import unittest
+from connection.messenger import MessageBuffer, Messenger
+
+
+class TestMessageBuffer(unittest.TestCase):
+
+    def receive(self, buffer: MessageBuffer, data: bytes) -> None:
+        while data:
+            free_space = buffer.get_free_space()
+            size = min(len(free_space), len(data))
+            free_space[:size] = data[:size]
+            buffer.mark_received(size)
+            data = data[size:]
+
+    def test_buffer_grows_for_large_message_and_shrinks_back(self) -> None:
+        buffer = MessageBuffer()
+        message = {"MESSAGE": "Chat", "TEXT": "x" * 100000}
+        self.receive(buffer, Messenger.encode_message(message))
+        self.assertGreater(len(buffer.get_free_space()), MessageBuffer.INITIAL_SIZE)
+        self.assertEqual([Messenger.decode_message(data) for data in buffer.extract_messages()], [message])
+        self.assertEqual(len(buffer.get_free_space()), MessageBuffer.INITIAL_SIZE)
+
+    def test_messages_split_between_reads(self) -> None:
+        buffer = MessageBuffer()
+        messages = [{"MESSAGE": "Move", "GAME": 1, "CELL": cell, "PLAYER": cell % 2} for cell in range(1000)]
+        data = b"".join(Messenger.encode_message(message, Messenger.PROTOCOL_VERSION) for message in messages)
+        received_messages = []
+        for start in range(0, len(data), 1000):
+            self.receive(buffer, data[start:start + 1000])
+            received_messages.extend(Messenger.decode_message(data) for data in buffer.extract_messages())
+        self.assertEqual(received_messages, messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
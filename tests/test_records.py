@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from typing import Tuple
+from engine.records import GameRecord, GameRecordFormat, GameRecordReader, GameRecordWriter
+
+
+def create_record(moves: Tuple[int, ...]) -> GameRecord:
+    return GameRecord(3, 3, 0, ("human", "search"), moves, 1)
+
+
+class TestGameRecords(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self._path: str = os.path.join(self._directory.name, "games.bin")
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_torn_record_is_cut_off(self) -> None:
+        with GameRecordWriter(self._path) as writer:
+            writer.write(create_record((4, 0, 8)))
+            writer.write(create_record((1, 2)))
+        with open(self._path, "ab") as file:
+            file.write(GameRecordFormat.encode_record(create_record((0, 1, 2, 3, 4)))[:15])
+        with self.assertLogs(level="WARNING"), GameRecordWriter(self._path) as writer:
+            writer.write(create_record((6, 7)))
+        with GameRecordReader(self._path) as reader:
+            self.assertEqual([record.moves for record in reader], [(4, 0, 8), (1, 2), (6, 7)])
+
+    def test_corrupted_records_are_rejected(self) -> None:
+        with GameRecordWriter(self._path):
+            pass
+        with open(self._path, "ab") as file:
+            file.write(GameRecordFormat.RECORD_HEADER.pack(1, 3, 3, 0, 0, 0, 3, 2) + bytes((4, 0)))
+            file.write(GameRecordFormat.RECORD_HEADER.pack(1, 3, 3, 0, 100, 0, 1, 1) + bytes((4,)))
+        with GameRecordReader(self._path) as reader:
+            self.assertEqual(len(reader), 2)
+            for index in range(2):
+                with self.assertRaises(ValueError):
+                    reader[index]
+
+
+if __name__ == "__main__":
+    unittest.main()
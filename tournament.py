@@ -0,0 +1,321 @@
+import argparse
+import itertools
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from engine.board import Board
+from engine.mcts import MctsEngine
+from engine.search import SearchEngine
+from engine.solved_table import load_solved_table
+from monitoring import profiling, tracing
+
+
+class GameTask(NamedTuple):
+    """
+    Parameters of one game of tournament.
+    """
+
+    first: str
+    second: str
+    size: int
+    win_length: int
+    seed: int
+
+
+class GameResult(NamedTuple):
+    """
+    Result of one game of tournament.
+    """
+
+    first: str
+    second: str
+    winner: Optional[int]
+    moves_number: int
+    move_times: Tuple[List[float], List[float]]
+    playouts_per_second: Tuple[List[float], List[float]]
+
+
+class RandomEngine:
+    """
+    Class for engine that makes random moves.
+    """
+
+    def find_move(self, board: Board) -> int:
+        return random.choice(board.get_legal_moves())
+
+
+class TableEngine:
+    """
+    Class for engine that takes moves from table of solved positions and searches moves that are not in table.
+    """
+
+    def __init__(self, **options) -> None:
+        self._engine: SearchEngine = SearchEngine(**options)
+
+    def find_move(self, board: Board) -> int:
+        table = load_solved_table()
+        if table is not None and table.is_applicable(board):
+            move = table.get_move(board)
+            if move is not None:
+                return move
+        return self._engine.find_move(board)
+
+
+ENGINE_TYPES: Dict[str, type] = {"mcts": MctsEngine,
+                                 "random": RandomEngine,
+                                 "search": SearchEngine,
+                                 "table": TableEngine}
+
+
+def _parse_value(value: str):
+    """
+    Function converts value of engine option from string.
+    :param value: string value.
+    :return: int, float, bool or string value.
+    """
+
+    for value_type in (int, float):
+        try:
+            return value_type(value)
+        except ValueError:
+            pass
+    if value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    return value
+
+
+def parse_engine_spec(spec: str) -> Tuple[str, str, Dict]:
+    """
+    Function parses engine configuration of form name=type[:option=value,...], for example
+    "fast=search:difficulty=medium,time_limit=0.1".
+    :param spec: engine configuration.
+    :return: name of engine, type of engine and options.
+    """
+
+    name, _, description = spec.partition("=")
+    engine_type, _, options_string = description.partition(":")
+    if not name or engine_type not in ENGINE_TYPES:
+        raise ValueError(f"Invalid engine configuration '{spec}', types of engines: {', '.join(ENGINE_TYPES)}")
+    options = {}
+    for option in filter(None, options_string.split(",")):
+        key, _, value = option.partition("=")
+        options[key] = _parse_value(value)
+    return name, engine_type, options
+
+
+@lru_cache(maxsize=None)
+def _create_engine(spec: str):
+    """
+    Function creates engine once per worker process.
+    :param spec: engine configuration.
+    :return: engine.
+    """
+
+    _, engine_type, options = parse_engine_spec(spec)
+    return ENGINE_TYPES[engine_type](**options)
+
+
+def play_game(task: GameTask) -> GameResult:
+    """
+    Function plays one game between two engines.
+    :param task: parameters of game.
+    :return: result of game.
+    """
+
+    random.seed(task.seed)
+    engines = _create_engine(task.first), _create_engine(task.second)
+    board = Board(task.size, task.win_length)
+    move_times = [], []
+    playouts_per_second = [], []
+    with tracing.span("play_game", "tournament"):
+        while not board.is_terminal():
+            engine = engines[board.turn]
+            start_time = time.perf_counter()
+            with tracing.span("find_move", "engine"), profiling.profile("ai"):
+                move = engine.find_move(board)
+            move_times[board.turn].append(time.perf_counter() - start_time)
+            if isinstance(engine, MctsEngine):
+                playouts_per_second[board.turn].append(engine.last_playouts_per_second)
+            board.make_move(move)
+    return GameResult(task.first, task.second, board.get_winner(), len(board.moves), move_times,
+                      playouts_per_second)
+
+
+def _play_games(tasks: List[GameTask], workers: Optional[int]) -> Iterator[GameResult]:
+    """
+    Function plays games in pool of processes and yields results as games finish. If profiling or tracing is turned
+    on, games are played one by one in current process, so profiles and spans of all games are saved together.
+    :param tasks: parameters of games;
+    :param workers: number of processes.
+    :return: results of games.
+    """
+
+    if profiling.is_enabled():
+        yield from map(play_game, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(play_game, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def estimate_elo(scores: Dict[Tuple[str, str], List[float]], names: List[str], iterations: int = 200
+                 ) -> Dict[str, float]:
+    """
+    Function estimates Elo ratings of engines by maximizing likelihood of results of games. Every pair of engines
+    gets one virtual draw, so ratings stay finite when one engine wins all games.
+    :param scores: dictionary with pairs of engines and scores of the first engine in their games;
+    :param names: names of engines;
+    :param iterations: number of iterations.
+    :return: ratings of engines, the average rating is 0.
+    """
+
+    ratings = {name: 0.0 for name in names}
+    games = []
+    for (first, second), pair_scores in scores.items():
+        games.extend((first, second, score) for score in pair_scores + [0.5])
+    for _ in range(iterations):
+        gradients = defaultdict(float)
+        counts = defaultdict(int)
+        for first, second, score in games:
+            expected = 1 / (1 + 10 ** ((ratings[second] - ratings[first]) / 400))
+            gradients[first] += score - expected
+            gradients[second] -= score - expected
+            counts[first] += 1
+            counts[second] += 1
+        for name in names:
+            if counts[name]:
+                ratings[name] += 400 * gradients[name] / counts[name]
+        average = sum(ratings.values()) / len(ratings)
+        ratings = {name: rating - average for name, rating in ratings.items()}
+    return ratings
+
+
+def get_percentile(values: List[float], percentile: float) -> float:
+    """
+    Function returns percentile of values by nearest-rank method.
+    :param values: sorted list of values;
+    :param percentile: percentile from 0 to 100.
+    :return: percentile.
+    """
+
+    if not values:
+        return math.nan
+    rank = max(1, math.ceil(percentile / 100 * len(values)))
+    return values[rank - 1]
+
+
+def print_report(results: List[GameResult], names: List[str]) -> None:
+    """
+    Function prints table of results of tournament. For Monte-Carlo engines median number of playouts per second
+    is printed.
+    :param results: results of games;
+    :param names: names of engines.
+    """
+
+    statistics = {name: [0, 0, 0] for name in names}
+    move_times = {name: [] for name in names}
+    playouts_per_second = {name: [] for name in names}
+    scores = defaultdict(list)
+    for result in results:
+        players = result.first, result.second
+        for player, name in enumerate(players):
+            move_times[name].extend(result.move_times[player])
+            playouts_per_second[name].extend(result.playouts_per_second[player])
+            if result.winner is None:
+                statistics[name][1] += 1
+            else:
+                statistics[name][0 if result.winner == player else 2] += 1
+        scores[players].append(0.5 if result.winner is None else 1.0 - result.winner)
+    ratings = estimate_elo(scores, names)
+
+    print(f"{'Engine':<20}{'Win':>7}{'Draw':>7}{'Loss':>7}{'Elo':>8}{'p50, ms':>10}{'p90, ms':>10}{'p99, ms':>10}"
+          f"{'max, ms':>10}{'playouts/s':>12}")
+    for name in sorted(names, key=ratings.get, reverse=True):
+        times = sorted(move_times[name])
+        percentiles = [1000 * get_percentile(times, percentile) for percentile in (50, 90, 99, 100)]
+        rates = sorted(playouts_per_second[name])
+        rate = f"{get_percentile(rates, 50):>12.0f}" if rates else f"{'-':>12}"
+        print(f"{name:<20}{statistics[name][0]:>7}{statistics[name][1]:>7}{statistics[name][2]:>7}"
+              f"{ratings[name]:>8.0f}" + "".join(f"{value:>10.1f}" for value in percentiles) + rate)
+
+
+def run_tournament(specs: List[str], size: int, win_length: int, games_number: int, workers: Optional[int],
+                   seed: int) -> List[GameResult]:
+    """
+    Function plays round-robin tournament between engines in pool of processes and prints results of games as they
+    finish.
+    :param specs: engine configurations;
+    :param size: number of rows and columns on playing field;
+    :param win_length: number of symbols in a row to win;
+    :param games_number: number of games for every pair of engines, engines change colors every game;
+    :param workers: number of processes, by default it is equal to number of processors, it is ignored if profiling
+    or tracing is turned on;
+    :param seed: seed for random number generators of games.
+    :return: results of games.
+    """
+
+    tasks = []
+    for first, second in itertools.combinations(specs, 2):
+        for game in range(games_number):
+            players = (first, second) if game % 2 == 0 else (second, first)
+            tasks.append(GameTask(*players, size, win_length, seed + len(tasks)))
+    names = {spec: parse_engine_spec(spec)[0] for spec in specs}
+
+    results = []
+    for result in _play_games(tasks, workers):
+        results.append(result)
+        winner = "draw" if result.winner is None else f"{names[(result.first, result.second)[result.winner]]} won"
+        print(f"[{len(results)}/{len(tasks)}] {names[result.first]} - {names[result.second]}: {winner} in "
+              f"{result.moves_number} moves", flush=True)
+    return [result._replace(first=names[result.first], second=names[result.second]) for result in results]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Round-robin tournament between engines without GUI")
+    parser.add_argument("--engine", action="append", dest="engines", required=True,
+                        help="engine configuration name=type[:option=value,...], types of engines: " +
+                             ", ".join(ENGINE_TYPES))
+    parser.add_argument("--size", type=int, default=3, help="number of rows and columns on playing field")
+    parser.add_argument("--win-length", type=int, default=None, help="number of symbols in a row to win")
+    parser.add_argument("--games", type=int, default=10, help="number of games for every pair of engines")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed for random number generators")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        names = [parse_engine_spec(spec)[0] for spec in args.engines]
+    except ValueError as exc:
+        parser.error(str(exc))
+    if len(set(names)) != len(names) or len(names) < 2:
+        parser.error("at least two engines with different names are required")
+    try:
+        profiling.setup(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+    win_length = args.size if args.win_length is None else args.win_length
+    try:
+        Board(args.size, win_length)
+    except ValueError as exc:
+        parser.error(str(exc))
+    for spec in args.engines:
+        try:
+            _create_engine(spec)
+        except (KeyError, TypeError, ValueError) as exc:
+            parser.error(f"invalid engine configuration '{spec}': {exc}")
+    try:
+        results = run_tournament(args.engines, args.size, win_length, args.games, args.workers, args.seed)
+    finally:
+        profiling.save()
+    print_report(results, names)
+
+
+if __name__ == "__main__":
+    sys.exit(main())